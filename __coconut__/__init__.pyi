@@ -205,7 +205,39 @@ _coconut_zip = zip
 
 
 zip_longest = _coconut.zip_longest
-memoize = _lru_cache
+
+
+class _coconut_persistent_memoize(_t.Generic[_T]):
+    def __call__(self, *args: _t.Any, **kwargs: _t.Any) -> _T: ...
+    def __get__(self, obj: _t.Any, objtype: _t.Optional[type] = None) -> _t.Callable[..., _T]: ...
+    def cache_info(self) -> _t.Tuple[int, int, _t.Optional[int], int]: ...
+    def cache_clear(self) -> None: ...
+
+@_t.overload
+def memoize(
+    maxsize: _t.Optional[int] = None,
+    typed: bool = False,
+) -> _t.Callable[[_t.Callable[..., _T]], _coconut.functools._lru_cache_wrapper[_T]]: ...
+@_t.overload
+def memoize(
+    maxsize: _t.Optional[int] = None,
+    typed: bool = False,
+    *,
+    persist: _t.Text,
+    ttl: _t.Optional[float] = None,
+) -> _t.Callable[[_t.Callable[..., _T]], _coconut_persistent_memoize[_T]]: ...
+@_t.overload
+def memoize(
+    _user_function: _t.Callable[..., _T],
+) -> _coconut.functools._lru_cache_wrapper[_T]:
+    """Decorator that memoizes a function, preventing it from being recomputed
+    if it is called multiple times with the same arguments.
+
+    If persist is passed, results are stored in a sqlite database at that path,
+    shared between processes and runs, and expire after ttl seconds if passed."""
+    ...
+
+
 reduce = _coconut.functools.reduce
 takewhile = _coconut.itertools.takewhile
 dropwhile = _coconut.itertools.dropwhile
@@ -584,9 +616,17 @@ def _coconut_call_or_coefficient(
 ) -> _T: ...
 
 
+@_t.overload
 def recursive_generator(func: _T_iter_func) -> _T_iter_func:
     """Decorator that memoizes a recursive function that returns an iterator (e.g. a recursive generator)."""
-    return func
+    ...
+@_t.overload
+def recursive_generator(
+    *,
+    maxsize: _t.Optional[int] = None,
+    ttl: _t.Optional[float] = None,
+    weak: bool = False,
+) -> _t.Callable[[_T_iter_func], _T_iter_func]: ...
 recursive_iterator = recursive_generator
 
 
@@ -1254,17 +1294,51 @@ def async_map(
     async_func: _t.Callable[[_T], _t.Awaitable[_U]],
     iter: _t.Iterable[_T],
     strict: bool = False,
+    max_concurrency: _t.Optional[int] = None,
+    ordered: bool = True,
 ) -> _t.Awaitable[_t.List[_U]]: ...
 @_t.overload
 def async_map(
     async_func: _t.Callable[..., _t.Awaitable[_U]],
     *iters: _t.Iterable,
     strict: bool = False,
+    max_concurrency: _t.Optional[int] = None,
+    ordered: bool = True,
 ) -> _t.Awaitable[_t.List[_U]]:
     """Map async_func over iters asynchronously using anyio."""
     ...
 
 
+class async_imap(_t.AsyncIterable[_U]):
+    """Map async_func over iters, which may be async iterables, asynchronously
+    using anyio, yielding results as they become available.
+
+    Iterating directly runs the calls in batches of max_concurrency (or all at once),
+    since an async generator can't keep a task group open across its yields;
+    use async with async_imap(...) as results to stream the results instead."""
+    @_t.overload
+    def __new__(
+        cls,
+        async_func: _t.Callable[[_T], _t.Awaitable[_U]],
+        iter: _t.Union[_t.Iterable[_T], _t.AsyncIterable[_T]],
+        strict: bool = False,
+        max_concurrency: _t.Optional[int] = None,
+        ordered: bool = True,
+    ) -> async_imap[_U]: ...
+    @_t.overload
+    def __new__(
+        cls,
+        async_func: _t.Callable[..., _t.Awaitable[_U]],
+        *iters: _t.Union[_t.Iterable, _t.AsyncIterable],
+        strict: bool = False,
+        max_concurrency: _t.Optional[int] = None,
+        ordered: bool = True,
+    ) -> async_imap[_U]: ...
+    def __aiter__(self) -> _t.AsyncIterator[_U]: ...
+    async def __aenter__(self) -> _t.AsyncIterator[_U]: ...
+    async def __aexit__(self, exc_type: _t.Any, exc_val: _t.Any, exc_tb: _t.Any) -> _t.Optional[bool]: ...
+
+
 def multi_enumerate(iterable: _Iterable) -> _t.Iterable[_t.Tuple[_t.Tuple[int, ...], _t.Any]]:
     """Enumerate an iterable of iterables. Works like enumerate, but indexes
     through inner iterables and produces a tuple index representing the index
@@ -1437,6 +1511,41 @@ class multiset(_t.Generic[_T], _coconut.collections.Counter[_T]):
 _coconut_multiset = multiset
 
 
+class data_array(_t.Sequence[_T]):
+    """Sequence of instances of data_type that stores each field in its own column.
+
+    int and float fields are stored in compact array.array columns, falling back to
+    a list if a field holds anything else. Pass columns={field: column} to use
+    existing columns (such as NumPy arrays) without copying them.
+
+    Elements are rebuilt from their fields on access, and .columns gives zero-copy
+    views of the underlying columns."""
+    data_type: _t.Type[_T]
+    def __new__(
+        cls,
+        data_type: _t.Type[_T],
+        iterable: _t.Iterable[_T] = (),
+        columns: _t.Optional[_t.Mapping[_t.Text, _t.Any]] = None,
+    ) -> data_array[_T]: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> _t.Iterator[_T]: ...
+    @_t.overload
+    def __getitem__(self, index: _SupportsIndex) -> _T: ...
+    @_t.overload
+    def __getitem__(self, index: slice) -> data_array[_T]: ...
+    @property
+    def columns(self) -> _t.Dict[_t.Text, _t.Any]:
+        """Dictionary mapping each field to a zero-copy view of its column."""
+        ...
+    def append(self, item: _T) -> None:
+        """Append an instance of data_type."""
+        ...
+    def extend(self, iterable: _t.Iterable[_T]) -> None:
+        """Append every instance of data_type in iterable."""
+        ...
+    def __fmap__(self, func: _t.Callable[[_T], _U]) -> _t.Union[data_array[_U], _t.List[_U]]: ...
+
+
 class _FMappable(_t.Protocol[_Tfunc_contra, _Tco]):
     def __fmap__(self, func: _Tfunc_contra) -> _Tco: ...
 
@@ -1920,6 +2029,42 @@ def _coconut_arr_concat_op(
 def _coconut_arr_concat_op(dim: int, *arrs: _t.Any) -> _Sequence: ...
 
 
+@_t.overload
+def _coconut_arr_literal(
+    dim: _t.Literal[1],
+    subspecs: _t.Any,
+    *leaves: _t.Sequence[_T],
+) -> _t.Sequence[_T]: ...
+@_t.overload
+def _coconut_arr_literal(
+    dim: _t.Literal[1],
+    subspecs: _t.Any,
+    *leaves: _T,
+) -> _t.Sequence[_T]: ...
+
+@_t.overload
+def _coconut_arr_literal(
+    dim: _t.Literal[2],
+    subspecs: _t.Any,
+    *leaves: _t.Sequence[_t.Sequence[_T]],
+) -> _t.Sequence[_t.Sequence[_T]]: ...
+@_t.overload
+def _coconut_arr_literal(
+    dim: _t.Literal[2],
+    subspecs: _t.Any,
+    *leaves: _t.Sequence[_T],
+) -> _t.Sequence[_t.Sequence[_T]]: ...
+@_t.overload
+def _coconut_arr_literal(
+    dim: _t.Literal[2],
+    subspecs: _t.Any,
+    *leaves: _T,
+) -> _t.Sequence[_t.Sequence[_T]]: ...
+
+@_t.overload
+def _coconut_arr_literal(dim: int, subspecs: _t.Any, *leaves: _t.Any) -> _Sequence: ...
+
+
 class _coconut_SupportsAdd(_t.Protocol, _t.Generic[_Tco, _Ucontra, _Vco]):
     """Coconut (+) Protocol. Equivalent to:
 
@@ -30,8 +30,16 @@ import weakref as _weakref
 import multiprocessing as _multiprocessing
 import pickle as _pickle
 import inspect as _inspect
+import time as _time
+import bisect as _bisect
+import array as _array
 from multiprocessing import dummy as _multiprocessing_dummy
 
+if sys.version_info >= (3, 8):
+    from multiprocessing import shared_memory as _multiprocessing_shared_memory
+else:
+    _multiprocessing_shared_memory = None
+
 if sys.version_info >= (3,):
     import builtins as _builtins
 else:
@@ -88,8 +96,12 @@ traceback = _traceback
 weakref = _weakref
 multiprocessing = _multiprocessing
 inspect = _inspect
+time = _time
+bisect = _bisect
+array = _array
 
 multiprocessing_dummy = _multiprocessing_dummy
+multiprocessing_shared_memory = _multiprocessing_shared_memory
 
 copyreg = _copyreg
 asyncio = _asyncio
@@ -105,6 +117,7 @@ abc = _abc
 abc.Sequence.register(collections.deque)
 
 numpy = _numpy
+numpy_ndarray: _t.Any = ...
 npt = _npt  # Fake, like typing
 zip_longest = _zip_longest
 
@@ -116,6 +129,8 @@ jax_numpy_modules: _t.Any = ...
 tee_type: _t.Any = ...
 reiterables: _t.Any = ...
 fmappables: _t.Any = ...
+arr_literal_list_types: _t.Any = ...
+get_ndim: _t.Any = ...
 
 Ellipsis = _builtins.Ellipsis
 NotImplemented = _builtins.NotImplemented
@@ -126,9 +141,12 @@ ImportError = _builtins.ImportError
 IndexError = _builtins.IndexError
 KeyError = _builtins.KeyError
 NameError = _builtins.NameError
+OverflowError = _builtins.OverflowError
 TypeError = _builtins.TypeError
 ValueError = _builtins.ValueError
 StopIteration = _builtins.StopIteration
+GeneratorExit = _builtins.GeneratorExit
+StopAsyncIteration = _builtins.StopAsyncIteration
 RuntimeError = _builtins.RuntimeError
 callable = _builtins.callable
 chr = _builtins.chr
@@ -156,6 +174,7 @@ list = _builtins.list
 locals = _builtins.locals
 globals = _builtins.globals
 map = _builtins.map
+memoryview = _builtins.memoryview
 min = _builtins.min
 max = _builtins.max
 next = _builtins.next
@@ -168,6 +187,7 @@ reversed = _builtins.reversed
 set = _builtins.set
 setattr = _builtins.setattr
 slice = _builtins.slice
+sorted = _builtins.sorted
 str = _builtins.str
 sum = _builtins.sum
 super = _builtins.super
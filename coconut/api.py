@@ -21,6 +21,7 @@ from coconut.root import *  # NOQA
 
 import sys
 import os.path
+import json
 import codecs
 from functools import partial
 from setuptools import PackageFinder
@@ -30,11 +31,11 @@ except ImportError:
     utf_8 = None
 
 from coconut.root import _coconut_exec
-from coconut.util import override
+from coconut.util import override, univ_open
 from coconut.integrations import embed
 from coconut.exceptions import CoconutException
 from coconut.command.command import Command
-from coconut.command.cli import cli_version
+from coconut.command.cli import arguments, cli_version
 from coconut.command.util import proc_run_args
 from coconut.compiler import Compiler
 from coconut.constants import (
@@ -44,6 +45,7 @@ from coconut.constants import (
     coconut_kernel_kwargs,
     default_use_cache_dir,
     coconut_cache_dir,
+    import_record_ext,
 )
 
 # -----------------------------------------------------------------------------------------------------------------------
@@ -202,6 +204,8 @@ class CoconutImporter(object):
     command = None
 
     def __init__(self, *args):
+        self.dir_index = {}
+        self.compiled_stats = {}
         self.use_cache_dir(default_use_cache_dir)
         self.set_args(args)
 
@@ -213,10 +217,43 @@ class CoconutImporter(object):
             self.cache_dir = coconut_cache_dir
         else:
             self.cache_dir = None
+        self.compiled_stats.clear()
 
     def set_args(self, args):
         """Set the Coconut command line args to use for auto compilation."""
         self.args = proc_run_args(args)
+        self._can_compile_in_process = None
+        self.compiled_stats.clear()
+
+    @property
+    def can_compile_in_process(self):
+        """Whether the args just configure the compiler and so can be handled by compile_in_process.
+        Only parses the args on first use so that bad args are reported by the first compilation."""
+        if self._can_compile_in_process is None:
+            self._can_compile_in_process = self.get_can_compile_in_process()
+        return self._can_compile_in_process
+
+    def get_can_compile_in_process(self):
+        """Parse the args to determine whether they can be handled by compile_in_process."""
+        parsed_args = arguments.parse_args(self.args)
+        return not (
+            parsed_args.source is not None
+            or getattr(parsed_args, "and")
+            or parsed_args.code is not None
+            or parsed_args.package
+            or parsed_args.run
+            or parsed_args.interact
+            or parsed_args.watch
+            or parsed_args.no_write
+            or parsed_args.force
+            or parsed_args.display
+            or parsed_args.jupyter is not None
+            or parsed_args.mypy is not None
+            or parsed_args.pyright
+            or parsed_args.stack_size
+            # compile_file only writes one file, but multiple targets need one per target
+            or parsed_args.target is not None and "," in parsed_args.target
+        )
 
     def cmd(self, *args):
         """Run the Coconut compiler with the given args."""
@@ -224,6 +261,15 @@ class CoconutImporter(object):
             self.command = Command()
         return self.command.cmd_sys(list(args) + self.args, interact=False)
 
+    def compile_in_process(self, filepath, dest):
+        """Compile a file using the compiler already set up by a previous call to cmd,
+        skipping argument processing and leaving the file alone if its hash is unchanged."""
+        destpath = None
+        self.command.exit_code = 0
+        with self.command.handling_exceptions(exit_on_error=True):
+            destpath = self.command.compile_file(filepath, dest, show_unchanged=False)
+        return destpath
+
     def compile(self, path, package):
         """Compile a path to a file or package."""
         extra_args = []
@@ -239,9 +285,83 @@ class CoconutImporter(object):
         if package:
             self.cmd(path, *extra_args)
             return cache_dir or path
+
+        # skip reading and hashing the source if neither it nor its compiled file has changed since we last compiled it
+        source_stat = self.get_stat(path)
+        cached = self.compiled_stats.get(path)
+        if cached is None and source_stat is not None and cache_dir is not None:
+            cached = self.load_record(self.get_record_path(path, cache_dir))
+        if source_stat is not None and cached is not None and cached[0] == source_stat and self.get_stat(cached[1]) == cached[2]:
+            self.compiled_stats[path] = cached
+            return cached[1]
+
+        if self.command is not None and self.command.comp is not None and self.can_compile_in_process:
+            destpath = self.compile_in_process(path, cache_dir or True)
         else:
             destpath, = self.cmd(path, *extra_args)
-            return destpath
+        if source_stat is not None and destpath is not None:
+            self.compiled_stats[path] = (source_stat, destpath, self.get_stat(destpath))
+            if cache_dir is not None:
+                self.save_record(self.get_record_path(path, cache_dir), self.compiled_stats[path])
+        return destpath
+
+    def get_record_path(self, path, cache_dir):
+        """Get the path of the record of the last auto compilation of the given source file."""
+        return os.path.join(cache_dir, os.path.basename(path) + import_record_ext)
+
+    def load_record(self, record_path):
+        """Load the (source stat, compiled path, compiled stat) saved by save_record,
+        or None if there isn't one for the current Coconut version and args."""
+        try:
+            with univ_open(record_path, "r") as record_file:
+                version, args, source_stat, destpath, dest_stat = json.load(record_file)
+        except (IOError, OSError, ValueError, TypeError):
+            return None
+        if version != VERSION or args != self.args or source_stat is None or dest_stat is None:
+            return None
+        return (tuple(source_stat), destpath, tuple(dest_stat))
+
+    def save_record(self, record_path, compiled_stat):
+        """Save the given (source stat, compiled path, compiled stat) so that later processes can
+        import the compiled file without setting up the compiler or reading the source."""
+        source_stat, destpath, dest_stat = compiled_stat
+        temp_path = record_path + "." + str(os.getpid())
+        try:
+            with univ_open(temp_path, "w") as record_file:
+                json.dump([VERSION, self.args, source_stat, destpath, dest_stat], record_file)
+            # replace rather than write in place so concurrent imports never see a partial record
+            os.replace(temp_path, record_path)
+        except (IOError, OSError):
+            pass
+
+    def get_stat(self, path):
+        """Get the (mtime, size) of the given path, or None if it can't be accessed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def get_dir_contents(self, dirpath):
+        """Get the names in the given directory, cached until the directory's mtime changes."""
+        try:
+            mtime = os.stat(dirpath or os.curdir).st_mtime
+        except OSError:
+            return frozenset()
+        cached = self.dir_index.get(dirpath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            contents = frozenset(os.listdir(dirpath or os.curdir))
+        except OSError:
+            contents = frozenset()
+        self.dir_index[dirpath] = (mtime, contents)
+        return contents
+
+    def invalidate_caches(self):
+        """Clear the cached directory contents and file stats (called by importlib.invalidate_caches)."""
+        self.dir_index.clear()
+        self.compiled_stats.clear()
 
     def find_coconut(self, fullname, path=None):
         """Searches for a Coconut file of the given name and compiles it."""
@@ -253,15 +373,16 @@ class CoconutImporter(object):
             fullname = fullname[1:]
             basepaths.insert(0, path)
 
-        path_tail = os.path.join(*fullname.split("."))
+        name_parts = fullname.split(".")
+        dir_tail = os.path.join(*name_parts[:-1]) if len(name_parts) > 1 else ""
+        name = name_parts[-1]
         for path_head in basepaths:
-            path = os.path.join(path_head, path_tail)
-            filepath = path + self.ext
-            initpath = os.path.join(path, "__init__" + self.ext)
-            if os.path.exists(filepath):
-                return self.compile(filepath, package=False)
-            if os.path.exists(initpath):
-                return self.compile(path, package=True)
+            dirpath = os.path.join(path_head, dir_tail) if dir_tail else path_head
+            contents = self.get_dir_contents(dirpath)
+            if name + self.ext in contents:
+                return self.compile(os.path.join(dirpath, name + self.ext), package=False)
+            if name in contents and "__init__" + self.ext in self.get_dir_contents(os.path.join(dirpath, name)):
+                return self.compile(os.path.join(dirpath, name), package=True)
         return None
 
     def find_module(self, fullname, path=None):
@@ -79,6 +79,7 @@ def setup(
     keep_lines: bool = False,
     no_tco: bool = False,
     no_wrap: bool = False,
+    tree_shake: bool = False,
     *,
     state: Optional[Command] = ...,
 ) -> None:
@@ -89,6 +90,7 @@ def setup(
 def warm_up(
     streamline: bool = False,
     enable_incremental_mode: bool = False,
+    background: bool = False,
     *,
     state: Optional[Command] = ...,
 ) -> None:
@@ -89,7 +89,7 @@ arguments.add_argument(
     "-t", "--target",
     metavar="version",
     type=str,
-    help="specify target Python version (defaults to universal)",
+    help="specify target Python version (defaults to universal); pass multiple comma-separated targets to compile for each of them at once, sharing work between targets and writing each into its own subdirectory of the destination",
 )
 
 arguments.add_argument(
@@ -190,6 +190,12 @@ arguments.add_argument(
     help="number of additional processes to use (defaults to " + ascii(base_default_jobs) + ") (0 is no additional processes; 'sys' uses machine default)",
 )
 
+arguments.add_argument(
+    "--parallel-parse", "--parallelparse",
+    action="store_true",
+    help="when compiling a single large file, split it into chunks of top-level statements and parse them on --jobs processes (only on platforms that support fork)",
+)
+
 arguments.add_argument(
     "-f", "--force",
     action="store_true",
@@ -202,6 +208,19 @@ arguments.add_argument(
     help="reduce size of compiled Python",
 )
 
+arguments.add_argument(
+    "--tree-shake", "--treeshake",
+    action="store_true",
+    help="only include the parts of the Coconut header that are actually used by compiled files (or, in package mode, by the package)",
+)
+
+arguments.add_argument(
+    "--bytecode",
+    metavar="levels",
+    type=str,
+    help="also write hash-checked __pycache__ bytecode for compiled Python at the given comma-separated optimization levels (e.g. '0,1,2') ('sys' uses the current interpreter's level)",
+)
+
 arguments.add_argument(
     "--jupyter", "--ipython",
     type=str,
@@ -46,6 +46,7 @@ from coconut.terminal import (
 )
 from coconut.constants import (
     PY35,
+    PY37,
     fixpath,
     code_exts,
     comp_ext,
@@ -82,6 +83,7 @@ from coconut.util import (
     get_clock_time,
     ensure_dir,
     first_import_time,
+    noop_ctx,
 )
 from coconut.command.util import (
     showpath,
@@ -108,8 +110,9 @@ from coconut.command.util import (
 from coconut.compiler.util import (
     should_indent,
     get_target_info_smart,
+    normalize_target,
 )
-from coconut.compiler.header import gethash
+from coconut.compiler.header import gethash, tree_shake_header
 from coconut.command.cli import arguments, cli_version
 
 # -----------------------------------------------------------------------------------------------------------------------
@@ -128,11 +131,15 @@ class Command(object):
     display = False  # corresponds to --display flag
     jobs = 0  # corresponds to --jobs flag
     mypy_args = None  # corresponds to --mypy flag
+    bytecode_levels = None  # corresponds to --bytecode flag
+    targets = None  # corresponds to --target with multiple comma-separated targets
+    multi_target_stats = None  # [files, full compilations, compile time, estimated separate compile time] for --target
     pyright = False  # corresponds to --pyright flag
     argv_args = None  # corresponds to --argv flag
     stack_size = 0  # corresponds to --stack-size flag
     use_cache = USE_CACHE  # corresponds to --no-cache flag
     fail_fast = False  # corresponds to --fail-fast flag
+    shake_package_dirs = None  # package directories whose __coconut__.py should be tree shaken, mapped to their targets
 
     prompt = Prompt()
 
@@ -276,6 +283,13 @@ class Command(object):
                 raise CoconutException("cannot compile as both --package (implied by --{type_checking_arg}) and --standalone".format(type_checking_arg=type_checking_arg))
             if args.no_write and type_checking_arg:
                 raise CoconutException("cannot compile with --no-write when using --{type_checking_arg}".format(type_checking_arg=type_checking_arg))
+            if args.no_write and args.bytecode is not None:
+                raise CoconutException("cannot compile with --no-write when using --bytecode")
+            if args.target is not None and "," in args.target:
+                if args.run or args.interact or args.watch:
+                    raise CoconutException("cannot --run, --interact, or --watch when compiling for multiple targets")
+                if type_checking_arg:
+                    raise CoconutException("cannot compile for multiple targets when using --{type_checking_arg}".format(type_checking_arg=type_checking_arg))
             for and_args in getattr(args, "and") or []:
                 if len(and_args) > 2:
                     raise CoconutException(
@@ -301,6 +315,9 @@ class Command(object):
                 self.argv_args = list(args.argv)
             if args.no_cache:
                 self.use_cache = False
+            if args.bytecode is not None:
+                self.set_bytecode_levels(args.bytecode)
+            self.set_targets(args.target)
 
             # execute non-compilation tasks
             if args.docs:
@@ -323,13 +340,14 @@ class Command(object):
                     or args.mypy is not None
                 )
             self.setup(
-                target=args.target,
+                target=args.target if self.targets is None else self.targets[0],
                 strict=args.strict,
                 minify=args.minify,
                 line_numbers=line_numbers,
                 keep_lines=args.keep_lines,
                 no_tco=args.no_tco,
                 no_wrap=args.no_wrap_types,
+                tree_shake=args.tree_shake,
             )
             if not self.using_jobs:
                 self.comp.warm_up(
@@ -369,7 +387,9 @@ class Command(object):
 
                 # disable jobs if we know we're only compiling one file
                 if len(all_compile_path_kwargs) <= 1 and not any(os.path.isdir(kwargs["source"]) for kwargs in all_compile_path_kwargs):
-                    self.disable_jobs()
+                    if args.parallel_parse:
+                        self.comp.parallel_parse_workers = self.get_max_workers()
+                    self.disable_jobs(warn=not args.parallel_parse)
 
                 # do main compilation
                 exit_on_error = extra_compile_path_kwargs or not (
@@ -379,6 +399,8 @@ class Command(object):
                 with self.running_jobs(exit_on_error=exit_on_error):
                     for kwargs in all_compile_path_kwargs:
                         filepaths += self.compile_path(**kwargs)
+                if self.targets is not None:
+                    self.show_multi_target_stats()
 
                 # run type checking on compiled files
                 self.run_type_checking(filepaths)
@@ -459,6 +481,8 @@ class Command(object):
             raise CoconutException("destination path cannot be given when --no-write is enabled")
         else:
             processed_dest = dest
+        if self.targets is not None and processed_dest is True:
+            raise CoconutException("a destination directory must be given when compiling for multiple targets")
 
         # determine package mode
         if args.package or self.type_checking:
@@ -512,6 +536,9 @@ class Command(object):
         """Compile a path and return paths to compiled files."""
         if not isinstance(dest, bool):
             dest = fixpath(dest)
+            if self.targets is not None:
+                # each target gets its own subdirectory of the base destination directory
+                kwargs["dest_root"] = os.path.dirname(dest) if os.path.splitext(dest)[1] else dest
         if os.path.isfile(source):
             destpath = self.compile_file(source, dest, package, **kwargs)
             return [destpath] if destpath is not None else []
@@ -578,11 +605,16 @@ class Command(object):
         self.compile(filepath, destpath, package, force=force, **kwargs)
         return destpath
 
-    def compile(self, codepath, destpath=None, package=False, run=False, force=False, show_unchanged=True, handling_exceptions_kwargs={}, callback=None):
+    def compile(self, codepath, destpath=None, package=False, run=False, force=False, show_unchanged=True, handling_exceptions_kwargs={}, callback=None, dest_root=None):
         """Compile a source Coconut file to a destination Python file."""
         with univ_open(codepath, "r") as opened:
             code = opened.read()
 
+        if self.targets is not None:
+            internal_assert(not run, "cannot run when compiling for multiple targets")
+            self.compile_multi_target(codepath, code, destpath, dest_root, package, force, show_unchanged, handling_exceptions_kwargs, callback)
+            return
+
         package_level = -1
         if destpath is not None:
             destpath = fixpath(destpath)
@@ -592,6 +624,7 @@ class Command(object):
                 package_level = self.get_package_level(codepath)
                 if package_level == 0:
                     self.create_package(destdir)
+                self.add_shake_package_dir(destdir, package_level)
 
         foundhash = None if force else self.has_hash_of(destpath, code, package_level)
         if foundhash:
@@ -599,6 +632,8 @@ class Command(object):
                 logger.show_tabulated("Left unchanged", showpath(destpath), "(pass --force to overwrite).")
             if self.display:
                 logger.print(foundhash)
+            if self.bytecode_levels is not None:
+                self.write_bytecode(destpath, only_missing=True)
             if run:
                 self.execute_file(destpath, argv_source_path=codepath)
             if callback is not None:
@@ -614,6 +649,8 @@ class Command(object):
                     with univ_open(destpath, "w") as opened:
                         opened.write(compiled)
                     logger.show_tabulated("Compiled to", showpath(destpath), ".")
+                    if self.bytecode_levels is not None:
+                        self.write_bytecode(destpath)
                 if self.display:
                     logger.print(compiled)
                 if run:
@@ -635,6 +672,98 @@ class Command(object):
             else:
                 raise CoconutInternalException("invalid value for package", package)
 
+    def compile_multi_target(self, codepath, code, destpath, dest_root, package, force, show_unchanged, handling_exceptions_kwargs, callback):
+        """Compile a source Coconut file for each of self.targets, writing each to its own directory."""
+        destpaths = {}
+        if destpath is not None:
+            rel_destpath = os.path.relpath(fixpath(destpath), dest_root)
+            for target in self.targets:
+                destpaths[target] = fixpath(os.path.join(dest_root, target, rel_destpath))
+
+        package_level = -1
+        if package is True:
+            package_level = self.get_package_level(codepath)
+        for target, target_destpath in destpaths.items():
+            destdir = os.path.dirname(target_destpath)
+            ensure_dir(destdir, logger=logger)
+            if package_level == 0:
+                with self.comp.using_target(target):
+                    self.create_package(destdir)
+            if package is True:
+                self.add_shake_package_dir(destdir, package_level, target)
+
+        def has_hash_for(target):
+            with self.comp.using_target(target):
+                return self.has_hash_of(destpaths[target], code, package_level)
+
+        if not force and destpaths and all(has_hash_for(target) for target in self.targets):
+            for target_destpath in destpaths.values():
+                if show_unchanged:
+                    logger.show_tabulated("Left unchanged", showpath(target_destpath), "(pass --force to overwrite).")
+                if self.bytecode_levels is not None:
+                    self.write_bytecode(target_destpath, only_missing=True)
+                if callback is not None:
+                    callback(target_destpath)
+            return
+
+        logger.show_tabulated("Compiling", showpath(codepath), "...")
+
+        def inner_callback(result):
+            compiled_by_target, num_compilations, compile_time, separate_time = result
+            self.multi_target_stats[0] += 1
+            self.multi_target_stats[1] += num_compilations
+            self.multi_target_stats[2] += compile_time
+            self.multi_target_stats[3] += separate_time
+            for target, compiled in compiled_by_target.items():
+                target_destpath = destpaths.get(target)
+                if target_destpath is None:
+                    logger.show_tabulated("Compiled", showpath(codepath), "for target " + target + " without writing to file.")
+                else:
+                    with univ_open(target_destpath, "w") as opened:
+                        opened.write(compiled)
+                    logger.show_tabulated("Compiled to", showpath(target_destpath), ".")
+                    if self.bytecode_levels is not None:
+                        self.write_bytecode(target_destpath)
+                if self.display:
+                    logger.print(compiled)
+                if callback is not None:
+                    callback(target_destpath)
+
+        if package is True:
+            self.submit_comp_job(codepath, inner_callback, handling_exceptions_kwargs, "parse_multi_target", self.targets, "parse_package", code, package_level=package_level, codepath=codepath)
+        elif package is False:
+            self.submit_comp_job(codepath, inner_callback, handling_exceptions_kwargs, "parse_multi_target", self.targets, "parse_file", code, codepath=codepath)
+        else:
+            raise CoconutInternalException("invalid value for package", package)
+
+    def set_targets(self, target):
+        """Set self.targets if target specifies multiple comma-separated targets."""
+        if target is None or "," not in target:
+            self.targets = None
+            return
+        targets = tuple(target.split(","))
+        normalized_targets = [normalize_target(target) for target in targets]
+        if "" in targets or len(set(normalized_targets)) < len(normalized_targets):
+            raise CoconutException("--target got empty or duplicate targets in " + repr(target))
+        self.targets = targets
+        self.multi_target_stats = [0, 0, 0, 0]
+
+    def show_multi_target_stats(self):
+        """Show how much time compiling for multiple targets at once saved."""
+        num_files, num_compilations, compile_time, separate_time = self.multi_target_stats
+        if num_files:
+            logger.show_sig(
+                "Compiled {num_files} file(s) for targets {targets} using {num_compilations} full compilation(s) in {compile_time:.2f} secs"
+                " (compiling each target separately would have taken an estimated {separate_time:.2f} secs; saved {saved_time:.2f} secs).".format(
+                    num_files=num_files,
+                    targets=", ".join(self.targets),
+                    num_compilations=num_compilations,
+                    compile_time=compile_time,
+                    separate_time=separate_time,
+                    saved_time=separate_time - compile_time,
+                ),
+            )
+
     def get_package_level(self, codepath):
         """Get the relative level to the base directory of the package."""
         package_level = -1
@@ -657,12 +786,14 @@ class Command(object):
             package_level = 0
         return package_level
 
-    def create_package(self, dirpath, retries_left=create_package_retries):
+    def create_package(self, dirpath, retries_left=create_package_retries, header=None):
         """Set up a package directory."""
         filepath = os.path.join(dirpath, "__coconut__.py")
+        if header is None:
+            header = self.comp.getheader("__coconut__")
         try:
             with univ_open(filepath, "w") as opened:
-                opened.write(self.comp.getheader("__coconut__"))
+                opened.write(header)
         except OSError:
             logger.log_exc()
             if retries_left <= 0:
@@ -671,7 +802,38 @@ class Command(object):
                 # sleep a random amount of time from 0 to 0.1 seconds to
                 #  stagger calls across processes
                 time.sleep(random.random() / 10)
-                self.create_package(dirpath, retries_left - 1)
+                self.create_package(dirpath, retries_left - 1, header)
+
+    def add_shake_package_dir(self, destdir, package_level, target=None):
+        """Register the base package directory of destdir to have its __coconut__.py tree shaken if --tree-shake."""
+        if not self.comp.tree_shake:
+            return
+        for _ in range(package_level):
+            destdir = os.path.dirname(destdir)
+        if self.shake_package_dirs is None:
+            self.shake_package_dirs = {}
+        self.shake_package_dirs[destdir, target] = True
+
+    def shake_packages(self):
+        """Rewrite the __coconut__.py of each registered package to only include what the package's compiled files use.
+
+        Must only be called once all the files in the package have been compiled,
+        since the compiled files on disk (including those left unchanged) determine
+        what is used. All underscore imports are always kept, since every compiled
+        file in the package imports them by name."""
+        if not self.shake_package_dirs:
+            return
+        for dirpath, target in self.shake_package_dirs:
+            compiled_code = []
+            for walk_dirpath, _, filenames in os.walk(dirpath):
+                for filename in filenames:
+                    if filename != "__coconut__.py" and os.path.splitext(filename)[1] == comp_ext:
+                        with univ_open(os.path.join(walk_dirpath, filename), "r") as opened:
+                            compiled_code.append(opened.read())
+            with (self.comp.using_target(target) if target is not None else noop_ctx()):
+                header = self.comp.getheader("__coconut__")
+            self.create_package(dirpath, header=tree_shake_header(header, "\n".join(compiled_code)))
+        self.shake_package_dirs = None
 
     def submit_comp_job(self, path, callback, handling_exceptions_kwargs, method, *args, **kwargs):
         """Submits a job on self.comp to be run in parallel."""
@@ -758,9 +920,9 @@ class Command(object):
         if profile and self.jobs != 0:
             raise CoconutException("--profile incompatible with --jobs {jobs}".format(jobs=jobs))
 
-    def disable_jobs(self):
+    def disable_jobs(self, warn=True):
         """Disables use of --jobs."""
-        if self.jobs not in (0, 1, None):
+        if warn and self.jobs not in (0, 1, None):
             logger.warn("got --jobs {jobs} but only compiling one file; disabling --jobs".format(jobs=self.jobs))
         self.jobs = 0
         logger.log("Jobs:", self.jobs)
@@ -792,12 +954,51 @@ class Command(object):
                     self.executor = None
             else:
                 yield
+            # only safe once all the compilation jobs are done
+            self.shake_packages()
+
+    def set_bytecode_levels(self, levels):
+        """Set the optimization levels to write bytecode at."""
+        if not PY37:
+            raise CoconutException("--bytecode requires Python 3.7+ (for hash-based .pyc invalidation)")
+        if levels == "sys":
+            self.bytecode_levels = [sys.flags.optimize]
+        else:
+            try:
+                self.bytecode_levels = [int(level) for level in levels.split(",")]
+            except ValueError:
+                raise CoconutException("--bytecode levels must be 'sys' or comma-separated integers; not " + repr(levels))
+            for level in self.bytecode_levels:
+                if level not in (0, 1, 2):
+                    raise CoconutException("--bytecode optimization levels must be 0, 1, or 2; not " + repr(level))
+
+    def write_bytecode(self, destpath, only_missing=False):
+        """Write __pycache__ bytecode for the compiled file at each --bytecode optimization level."""
+        import py_compile
+        from importlib.util import cache_from_source
+        for level in self.bytecode_levels:
+            pycpath = cache_from_source(destpath, optimization=level if level else "")
+            if only_missing and os.path.isfile(pycpath):
+                continue
+            try:
+                py_compile.compile(
+                    destpath,
+                    cfile=pycpath,
+                    doraise=True,
+                    optimize=level,
+                    invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+                )
+            except py_compile.PyCompileError as err:
+                logger.warn("failed to write bytecode for " + showpath(destpath) + " at optimization level " + str(level), extra=str(err.msg))
+            else:
+                logger.log("Wrote bytecode to", showpath(pycpath))
 
     def has_hash_of(self, destpath, code, package_level):
         """Determine if a file has the hash of the code."""
         if destpath is not None and os.path.isfile(destpath):
             with univ_open(destpath, "r") as opened:
-                compiled = opened.read()
+                # the hash is always on the third line, so there's no need to read the rest
+                compiled = "".join(opened.readline() for _ in range(3))
             hashash = gethash(compiled)
             if hashash is not None:
                 newhash = self.comp.genhash(code, package_level)
@@ -824,7 +1025,8 @@ class Command(object):
 
     def start_running(self):
         """Start running the Runner."""
-        self.comp.warm_up(enable_incremental_mode=interpreter_uses_incremental)
+        # warm up in the background so the prompt shows up immediately
+        self.comp.warm_up(enable_incremental_mode=interpreter_uses_incremental, background=True)
         self.check_runner()
         self.running = True
         logger.log("Time till prompt: " + str(get_clock_time() - first_import_time) + " secs")
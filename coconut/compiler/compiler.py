@@ -33,10 +33,20 @@ from coconut.root import *  # NOQA
 import sys
 import os
 import re
+import ast
+import tokenize
+import time
+import multiprocessing
+from io import StringIO
+from bisect import bisect_right
 from contextlib import contextmanager
 from functools import partial, wraps
 from collections import defaultdict
-from threading import Lock
+from threading import (
+    RLock,
+    Thread,
+    current_thread,
+)
 
 from coconut._pyparsing import (
     USE_COMPUTATION_GRAPH,
@@ -52,9 +62,8 @@ from coconut._pyparsing import (
 
 from coconut.constants import (
     PY35,
-    specific_targets,
-    targets,
-    pseudo_targets,
+    PY37,
+    PY38,
     default_encoding,
     hash_sep,
     openindent,
@@ -94,6 +103,9 @@ from coconut.constants import (
     use_adaptive_any_of,
     reverse_any_of,
     tempsep,
+    reserved_vars,
+    parallel_parse_min_chunk_len,
+    parallel_parse_chunks_per_worker,
 )
 from coconut.util import (
     pickleable_obj,
@@ -125,7 +137,11 @@ from coconut.terminal import (
     complain,
     internal_assert,
 )
-from coconut.compiler.matching import Matcher, match_funcdef_setup_code
+from coconut.compiler.matching import (
+    Matcher,
+    match_funcdef_setup_code,
+    match_function_fast_path_code,
+)
 from coconut.compiler.grammar import (
     Grammar,
     lazy_list_handle,
@@ -140,7 +156,6 @@ from coconut.compiler.grammar import (
 )
 from coconut.compiler.util import (
     ExceptionNode,
-    sys_target,
     getline,
     addskip,
     count_end,
@@ -178,20 +193,32 @@ from coconut.compiler.util import (
     close_char_for,
     base_keyword,
     enable_incremental_parsing,
-    get_psf_target,
+    force_reset_packrat_cache,
+    normalize_target,
+    RecordingTargetInfo,
+    checks_hold_for,
     move_loc_to_non_whitespace,
     move_endpt_to_non_whitespace,
     load_cache_for,
     pickle_cache,
+    can_use_grammar_snapshot,
+    get_grammar_snapshot_key,
+    get_grammar_snapshot_path,
+    save_grammar_snapshot,
+    load_grammar_snapshot,
     handle_and_manage,
     manage,
     sub_all,
     ComputationNode,
     StartOfStrGrammar,
+    OriginalPlaceholder,
+    map_nested,
+    split_top_level_chunks,
 )
 from coconut.compiler.header import (
     minify_header,
     getheader,
+    tree_shake_header,
 )
 
 # end: IMPORTS
@@ -259,6 +286,16 @@ def get_imported_names(imports):
     return saw_names, saw_star
 
 
+def get_func_returns(func_node):
+    """Yields the return statements belonging to the given ast function node (not to any inner functions)."""
+    for child in ast.iter_child_nodes(func_node):
+        if isinstance(child, ast.Return):
+            yield child
+        elif not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            for ret in get_func_returns(child):
+                yield ret
+
+
 def special_starred_import_handle(imp_all=False):
     """Handles the [from *] import * Coconut Easter egg."""
     out = handle_indentation(
@@ -402,8 +439,17 @@ def call_decorators(decorators, func_name):
 
 class Compiler(Grammar, pickleable_obj):
     """The Coconut compiler."""
-    lock = Lock()
+    lock = RLock()  # held while parsing, setting up, resetting, or warming up
     current_compiler = None
+    grammar_snapshot_used = False
+    warm_up_thread = None
+    warm_up_exc = None
+    warm_up_time = None
+    parallel_parse_workers = 0  # 0 for no parallel parsing; None for one worker per cpu
+    parallel_parse_job = None
+
+    ref_marker_regex = compile_regex(r"(?<![0-9" + lnwrapper + r"])([0-9]+)" + unwrapper + "|" + funcwrapper + r"([0-9]+)\n")
+    temp_var_regex = compile_regex(r"\b" + reserved_prefix + r"_\w*_[0-9]+\b")
 
     preprocs = [
         lambda self: self.prepare,
@@ -422,10 +468,11 @@ class Compiler(Grammar, pickleable_obj):
         lambda self: partial(self.base_passthrough_repl, wrap_char="\\"),
         lambda self: self.str_repl,
     ]
-    postprocs = reformatprocs + [
+    headerprocs = [
         lambda self: self.header_proc,
         lambda self: self.polish,
     ]
+    postprocs = reformatprocs + headerprocs
 
     def __init__(self, *args, **kwargs):
         """Creates a new compiler with the given parsing parameters."""
@@ -433,39 +480,23 @@ class Compiler(Grammar, pickleable_obj):
         self.reset()
 
     # changes here should be reflected in __reduce__, get_cli_args, and in the stub for coconut.api.setup
-    def setup(self, target=None, strict=False, minify=False, line_numbers=True, keep_lines=False, no_tco=False, no_wrap=False):
+    def setup(self, target=None, strict=False, minify=False, line_numbers=True, keep_lines=False, no_tco=False, no_wrap=False, tree_shake=False):
         """Initializes parsing parameters."""
-        if target is None:
-            target = ""
-        else:
-            target = str(target)
-        if len(target) > 1 and target[1] == ".":
-            target = target[:1] + target[2:]
-        if "." in target:
-            raise CoconutException("target Python version must be major.minor, not major.minor.micro")
-        if target == "sys":
-            target = sys_target
-        elif target == "psf":
-            target = get_psf_target()
-        if target in pseudo_targets:
-            target = pseudo_targets[target]
-        if target not in targets:
-            raise CoconutException(
-                "unsupported target Python version " + repr(target),
-                extra="supported targets are: " + ", ".join(repr(t) for t in specific_targets + tuple(pseudo_targets)) + ", 'sys', 'psf'",
-            )
-        logger.log_vars("Compiler args:", locals())
-        self.target = target
-        self.strict = strict
-        self.minify = minify
-        self.line_numbers = line_numbers
-        self.keep_lines = keep_lines
-        self.no_tco = no_tco
-        self.no_wrap = no_wrap
+        with self.lock:
+            target = normalize_target(target)
+            logger.log_vars("Compiler args:", locals())
+            self.target = target
+            self.strict = strict
+            self.minify = minify
+            self.line_numbers = line_numbers
+            self.keep_lines = keep_lines
+            self.no_tco = no_tco
+            self.no_wrap = no_wrap
+            self.tree_shake = tree_shake
 
     def __reduce__(self):
         """Return pickling information."""
-        return (self.__class__, (self.target, self.strict, self.minify, self.line_numbers, self.keep_lines, self.no_tco, self.no_wrap))
+        return (self.__class__, (self.target, self.strict, self.minify, self.line_numbers, self.keep_lines, self.no_tco, self.no_wrap, self.tree_shake))
 
     def get_cli_args(self):
         """Get the Coconut CLI args that can be used to set up an equivalent compiler."""
@@ -482,6 +513,8 @@ class Compiler(Grammar, pickleable_obj):
             args.append("--no-tco")
         if self.no_wrap:
             args.append("--no-wrap-types")
+        if self.tree_shake:
+            args.append("--tree-shake")
         return args
 
     def __copy__(self):
@@ -520,34 +553,37 @@ class Compiler(Grammar, pickleable_obj):
 
         IMPORTANT: When adding anything here, consider whether it should also be added to inner_environment.
         """
-        self.filename = filename
-        self.outer_ln = None
-        self.indchar = None
-        self.comments = defaultdict(set)
-        self.wrapped_type_ignore = None
-        self.refs = []
-        self.skips = []
-        self.docstring = ""
-        # need to keep temp_var_counts in interpreter to avoid overwriting typevars
-        if self.temp_var_counts is None or not keep_state:
-            self.temp_var_counts = defaultdict(int)
-        # but always overwrite temp_vars_by_key since they store locs that will be invalidated
-        self.temp_vars_by_key = {}
-        self.parsing_context = defaultdict(list)
-        self.name_info = defaultdict(lambda: {"imported": [], "referenced": [], "assigned": []})
-        self.star_import = False
-        self.kept_lines = []
-        self.num_lines = 0
-        self.disable_name_check = False
-        if self.operators is None or not keep_state:
-            self.operators = []
-            self.operator_repl_table = []
-        self.add_code_before = {}
-        self.add_code_before_regexes = {}
-        self.add_code_before_replacements = {}
-        self.add_code_before_ignore_names = {}
-        self.remaining_original = None
-        self.shown_warnings = set()
+        with self.lock:
+            self.filename = filename
+            self.outer_ln = None
+            self.indchar = None
+            self.comments = defaultdict(set)
+            self.wrapped_type_ignore = None
+            self.refs = []
+            self.skips = []
+            self.docstring = ""
+            # need to keep temp_var_counts in interpreter to avoid overwriting typevars
+            if self.temp_var_counts is None or not keep_state:
+                self.temp_var_counts = defaultdict(int)
+            # but always overwrite temp_vars_by_key since they store locs that will be invalidated
+            self.temp_vars_by_key = {}
+            self.parsing_context = defaultdict(list)
+            self.name_info = defaultdict(lambda: {"imported": [], "referenced": [], "assigned": []})
+            self.star_import = False
+            self.kept_lines = []
+            self.num_lines = 0
+            self.disable_name_check = False
+            if self.operators is None or not keep_state:
+                self.operators = []
+                self.operator_repl_table = []
+            self.add_code_before = {}
+            self.add_code_before_regexes = {}
+            self.add_code_before_replacements = {}
+            self.add_code_before_ignore_names = {}
+            self.remaining_original = None
+            self.shown_warnings = set()
+            self.target_checks = set()
+            self.headerless_result = None
 
     @contextmanager
     def inner_environment(self, ln=None):
@@ -1146,10 +1182,29 @@ class Compiler(Grammar, pickleable_obj):
             header = self.polish(header)
         return header
 
+    @property
+    def target(self):
+        """The current target. Reading it directly means the exact target matters to the current compilation."""
+        self.target_info.depend_fully()
+        return self._target
+
+    @target.setter
+    def target(self, target):
+        self._target = target
+
+    @contextmanager
+    def using_target(self, target):
+        """Temporarily compile for the given target."""
+        old_target, self.target = self._target, normalize_target(target)
+        try:
+            yield
+        finally:
+            self.target = old_target
+
     @property
     def target_info(self):
-        """Return information on the current target as a version tuple."""
-        return get_target_info(self.target)
+        """Return information on the current target as a version tuple that records all checks made against it."""
+        return RecordingTargetInfo(get_target_info(self._target), self.target_checks)
 
     def make_err(self, errtype, message, original, loc=0, ln=None, extra=None, reformat=True, endpoint=None, include_causes=False, use_startpoint=False, **kwargs):
         """Generate an error of the specified type."""
@@ -1311,13 +1366,47 @@ class Compiler(Grammar, pickleable_obj):
             Compiler.current_compiler = self
             yield
 
+    @classmethod
+    def get_snapshot_parsers(cls):
+        """Get the parsers whose grammars are saved in the grammar snapshot."""
+        snapshot_parsers = []
+        for parser in (cls.file_parser, cls.eval_parser):
+            snapshot_parsers.extend(parser if isinstance(parser, tuple) else (parser,))
+        return snapshot_parsers
+
+    @classmethod
+    def use_grammar_snapshot(cls):
+        """Swap in the streamlined grammars from the grammar snapshot, creating it if necessary.
+        Returns whether the snapshot parsers are now streamlined."""
+        if cls.grammar_snapshot_used:
+            return True
+        if not can_use_grammar_snapshot() or cls.grammar_names_set:
+            return False
+        snapshot_parsers = cls.get_snapshot_parsers()
+        snapshot_key = get_grammar_snapshot_key()
+        snapshot_path = get_grammar_snapshot_path(snapshot_key)
+        grammars = load_grammar_snapshot(snapshot_path, snapshot_key, len(snapshot_parsers))
+        if grammars is None:
+            for parser in snapshot_parsers:
+                prep_grammar(parser, for_scan=False, streamline=True)
+            save_grammar_snapshot([parser.grammar for parser in snapshot_parsers], snapshot_path, snapshot_key)
+        else:
+            for parser, grammar in zip(snapshot_parsers, grammars):
+                parser.grammar = grammar
+        cls.grammar_snapshot_used = True
+        return True
+
     def streamline(self, grammars, inputstring=None, force=False, inner=False):
         """Streamline the given grammar(s) for the given inputstring."""
         for grammar in grammars if isinstance(grammars, tuple) else (grammars,):
             input_len = 0 if inputstring is None else len(inputstring)
             if force or (streamline_grammar_for_len is not None and input_len > streamline_grammar_for_len):
                 start_time = get_clock_time()
-                prep_grammar(grammar, for_scan=False, streamline=True)
+                if not (
+                    any(grammar is parser for parser in self.get_snapshot_parsers())
+                    and self.use_grammar_snapshot()
+                ):
+                    prep_grammar(grammar, for_scan=False, streamline=True)
                 logger.log_lambda(
                     lambda: "Streamlined {grammar} in {time} seconds{info}.".format(
                         grammar=get_name(grammar),
@@ -1379,6 +1468,366 @@ class Compiler(Grammar, pickleable_obj):
                 init = False
         return "".join(out_parts)
 
+    def should_parse_in_parallel(self, parser, inputstring, keep_state=False):
+        """Determine whether inputstring should be parsed by parse_in_parallel."""
+        return (
+            self.parallel_parse_workers != 0
+            and PY37
+            and parser is self.file_parser
+            and not keep_state
+            and len(inputstring) >= 2 * parallel_parse_min_chunk_len
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+
+    def get_parallel_parse_state(self):
+        """Get the parsing state that parse_parallel_chunk reports changes to."""
+        return {
+            "num_refs": len(self.refs),
+            "temp_var_counts": dict(self.temp_var_counts),
+            "temp_vars_by_key": dict(self.temp_vars_by_key),
+            "add_code_before": dict(self.add_code_before),
+            "name_info": {name: {kind: len(locs) for kind, locs in info.items()} for name, info in self.name_info.items()},
+            "skips": set(self.skips),
+            "shown_warnings": set(self.shown_warnings),
+            "docstring": self.docstring,
+            "wrapped_type_ignore": self.wrapped_type_ignore,
+        }
+
+    @classmethod
+    def parse_parallel_chunk(cls, chunk_index):
+        """Parse one chunk of a parse_in_parallel job. Run in a forked worker process."""
+        self, parser, original, chunk_bounds, base_state = cls.parallel_parse_job
+        start, stop = chunk_bounds[chunk_index]
+        start_time = get_clock_time()
+        try:
+            with ComputationNode.using_overrides():
+                ComputationNode.override_original = original
+                ComputationNode.add_to_loc = start
+                self.remaining_original = original[start:stop]
+                parsed = parse(parser, self.remaining_original, inner=False)
+        except Exception:
+            # errors are reported by reparsing the whole file in the main process
+            logger.log_exc()
+            return None
+        parse_time = get_clock_time() - start_time
+
+        if any(self.add_code_before[name] != code for name, code in base_state["add_code_before"].items()):
+            return None
+        base_name_info = base_state["name_info"]
+        empty_info = defaultdict(int)
+        original_placeholder = OriginalPlaceholder()
+        return {
+            "parsed": parsed,
+            "parse_time": parse_time,
+            # the original is replaced since it's large and already known to the main process
+            "refs": map_nested(self.refs[base_state["num_refs"]:], lambda item: original_placeholder if item is original else item),
+            "temp_var_counts": {
+                base_name: count - base_state["temp_var_counts"].get(base_name, 0)
+                for base_name, count in self.temp_var_counts.items()
+            },
+            "temp_vars_by_key": [
+                (key, name) for key, name in self.temp_vars_by_key.items()
+                if key not in base_state["temp_vars_by_key"]
+            ],
+            "add_code_before": [
+                (
+                    name,
+                    code,
+                    self.add_code_before_replacements.get(name),
+                    self.add_code_before_ignore_names.get(name),
+                    self.add_code_before_regexes[name].pattern if name in self.add_code_before_regexes else None,
+                )
+                for name, code in self.add_code_before.items()
+                if name not in base_state["add_code_before"]
+            ],
+            "name_info": [
+                (name, [(kind, locs[base_name_info.get(name, empty_info)[kind]:]) for kind, locs in info.items()])
+                for name, info in self.name_info.items()
+            ],
+            "star_import": self.star_import,
+            "skips": [ln for ln in self.skips if ln not in base_state["skips"]],
+            "shown_warnings": self.shown_warnings - base_state["shown_warnings"],
+            "target_checks": self.target_checks,
+            "docstring": self.docstring if self.docstring != base_state["docstring"] else None,
+            "comments": [(ln, comments) for ln, comments in self.comments.items() if comments],
+            "wrapped_type_ignore": self.wrapped_type_ignore if self.wrapped_type_ignore != base_state["wrapped_type_ignore"] else None,
+        }
+
+    def merge_parallel_chunk(self, original, base_state, result, ref_offset, temp_var_offsets):
+        """Merge the result of parse_parallel_chunk into this compiler and return the renumbered parse.
+
+        Each chunk numbers its new refs and temp vars as if it were the first chunk, so they
+        are renumbered to what a sequential parse of all the chunks would have produced."""
+        base_num_refs = base_state["num_refs"]
+        renamed_temp_vars = {}
+        for base_name, num_used in result["temp_var_counts"].items():
+            offset = temp_var_offsets[base_name]
+            if offset:
+                first_count = base_state["temp_var_counts"].get(base_name, 0)
+                for count in range(first_count, first_count + num_used):
+                    renamed_temp_vars[reserved_prefix + "_" + base_name + "_" + str(count)] = reserved_prefix + "_" + base_name + "_" + str(count + offset)
+            temp_var_offsets[base_name] += num_used
+            self.temp_var_counts[base_name] += num_used
+
+        def renumber_ref(match):
+            ref_str = match.group(1) or match.group(2)
+            index = int(ref_str)
+            if index >= base_num_refs:
+                index += ref_offset
+            return match.group(0).replace(ref_str, str(index), 1)
+
+        def renumber(item):
+            if isinstance(item, OriginalPlaceholder):
+                return original
+            if not isinstance(item, str):
+                return item
+            if ref_offset:
+                item = self.ref_marker_regex.sub(renumber_ref, item)
+            if renamed_temp_vars:
+                item = self.temp_var_regex.sub(lambda match: renamed_temp_vars.get(match.group(0), match.group(0)), item)
+            return item
+
+        self.refs += map_nested(result["refs"], renumber)
+        for key, name in result["temp_vars_by_key"]:
+            self.temp_vars_by_key[key] = renumber(name)
+        for name, code, replacement, ignore_names, regex_pattern in result["add_code_before"]:
+            new_name = renumber(name)
+            self.add_code_before[new_name] = renumber(code)
+            if replacement is not None:
+                self.add_code_before_replacements[new_name] = renumber(replacement)
+            if ignore_names is not None:
+                self.add_code_before_ignore_names[new_name] = map_nested(ignore_names, renumber)
+            if regex_pattern is not None:
+                self.add_code_before_regexes[new_name] = compile_regex(regex_pattern.replace(name, new_name))
+        for name, new_info in result["name_info"]:
+            info = self.name_info[renumber(name)]
+            for kind, locs in new_info:
+                info[kind] += locs
+        self.star_import = self.star_import or result["star_import"]
+        if result["skips"]:
+            self.set_skips(self.skips + result["skips"])
+        self.shown_warnings |= result["shown_warnings"]
+        self.target_checks |= result["target_checks"]
+        if result["docstring"] is not None:
+            self.docstring = result["docstring"]
+        for ln, comments in result["comments"]:
+            self.comments[ln] |= comments
+        if result["wrapped_type_ignore"] is not None and self.wrapped_type_ignore is None:
+            self.wrapped_type_ignore = renumber(result["wrapped_type_ignore"])
+        return renumber(result["parsed"])
+
+    def parse_in_parallel(self, parser, original):
+        """Parse original by splitting it into chunks of top-level statements,
+        parsing each chunk in a forked worker process, and merging the results."""
+        from concurrent.futures import ProcessPoolExecutor
+        num_workers = self.parallel_parse_workers
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+        chunk_bounds = split_top_level_chunks(original, num_workers * parallel_parse_chunks_per_worker, parallel_parse_min_chunk_len)
+        if len(chunk_bounds) <= 1:
+            return parse(parser, original, inner=False)
+
+        start_time = time.time()
+        base_state = self.get_parallel_parse_state()
+        Compiler.parallel_parse_job = (self, parser, original, chunk_bounds, base_state)
+        try:
+            with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                results = list(executor.map(self.parse_parallel_chunk, range(len(chunk_bounds))))
+        except Exception:
+            logger.log_exc()
+            results = [None]
+        finally:
+            Compiler.parallel_parse_job = None
+        if any(result is None for result in results):
+            logger.log("Parallel parsing failed; reparsing without --parallel-parse.")
+            return parse(parser, original, inner=False)
+
+        out_parts = []
+        ref_offset = 0
+        temp_var_offsets = defaultdict(int)
+        for result in results:
+            out_parts.append(self.merge_parallel_chunk(original, base_state, result, ref_offset, temp_var_offsets))
+            ref_offset += len(result["refs"])
+
+        total_time = time.time() - start_time
+        single_core_time = sum(result["parse_time"] for result in results)
+        logger.show_sig("Parsed {num_chunks} chunks on {num_workers} processes in {total_time:.2f} secs (single core: {single_core_time:.2f} secs; {speedup:.2f}x speedup).".format(
+            num_chunks=len(chunk_bounds),
+            num_workers=num_workers,
+            total_time=total_time,
+            single_core_time=single_core_time,
+            speedup=single_core_time / total_time if total_time else float("inf"),
+        ))
+        return "".join(out_parts)
+
+    def plain_python_ast(self, inputstring):
+        """Get the ast of inputstring if it is plain Python code that parsing would leave
+        unchanged (aside from TCO) and raise no errors or warnings on, otherwise None."""
+        if not PY38 or self.operators:
+            return None
+        try:
+            tree = ast.parse(inputstring)
+            tokens = tuple(tokenize.generate_tokens(StringIO(inputstring).readline))
+        except (SyntaxError, ValueError, MemoryError, RecursionError, tokenize.TokenError):
+            return None
+
+        # scan for tokens that either mean something different in Coconut or that Coconut warns on
+        string_start_types = (tokenize.STRING, getattr(tokenize, "FSTRING_START", tokenize.STRING))
+        string_end_types = (tokenize.STRING, getattr(tokenize, "FSTRING_END", tokenize.STRING))
+        at_stmt_start = True
+        last_tok_type = None
+        for tok in tokens:
+            tok_type, tok_str = tok[:2]
+            if tok_type in (tokenize.NL, tokenize.COMMENT):
+                continue
+            if tok_type == tokenize.NAME:
+                if (
+                    tok_str.startswith(reserved_prefix)
+                    or tok_str == "\u03bb"
+                    or at_stmt_start and tok_str in reserved_vars
+                ):
+                    return None
+            elif tok_type in string_start_types:
+                if last_tok_type in string_end_types or tok_str.startswith(("u", "U")):
+                    return None
+            elif tok_type == tokenize.OP and tok_str == ";":
+                return None
+            at_stmt_start = tok_type in (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT) or tok_str == ":"
+            last_tok_type = tok_type
+
+        # scan for syntax that Coconut compiles differently or warns on
+        source_lines = tuple(literal_lines(inputstring))
+        bound_names = set()
+        imported_names = set()
+        referenced_names = set()
+        format_specs = set()
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, tuple(getattr(ast, name) for name in ("Match", "TryStar", "TypeAlias") if hasattr(ast, name)))
+                or getattr(node, "type_params", None)
+                or self.strict and isinstance(node, ast.Lambda)
+            ):
+                return None
+            elif isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Load):
+                    referenced_names.add(node.id)
+                else:
+                    bound_names.add(node.id)
+            elif isinstance(node, ast.arg):
+                bound_names.add(node.arg)
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                bound_names.update(node.names)
+            elif isinstance(node, ast.ExceptHandler):
+                if node.name is not None:
+                    bound_names.add(node.name)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                module = node.module if isinstance(node, ast.ImportFrom) else None
+                for alias in node.names:
+                    full_name = alias.name if module is None else module + "." + alias.name
+                    if alias.name == "*" or full_name.split(".", 1)[0] in ("__future__",) + tuple(import_existing):
+                        return None
+                    imported_names.add(alias.asname or alias.name.split(".", 1)[0])
+            elif isinstance(node, ast.ClassDef):
+                if any(isinstance(base, ast.Name) and base.id == "object" for base in node.bases):
+                    return None
+                bound_names.add(node.name)
+            elif isinstance(node, ast.FormattedValue):
+                if node.format_spec is not None:
+                    format_specs.add(node.format_spec)
+            elif isinstance(node, ast.JoinedStr):
+                if node not in format_specs and not any(isinstance(value, ast.FormattedValue) for value in node.values):
+                    return None
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                bound_names.add(node.name)
+                if isinstance(node, ast.FunctionDef):
+                    for ret in get_func_returns(node):
+                        if not isinstance(ret.value, ast.Call):
+                            continue
+                        # tail recursion elimination rewrites the whole function
+                        if isinstance(ret.value.func, ast.Name) and ret.value.func.id == node.name:
+                            return None
+                        # tco only works on returns at the start of their line
+                        if source_lines[ret.lineno - 1].encode(default_encoding)[:ret.col_offset].strip():
+                            return None
+
+        # anything that would produce a name warning needs the full parse to produce it
+        if (
+            bound_names & all_builtins
+            or imported_names - referenced_names
+            or referenced_names - all_builtins - bound_names - imported_names
+        ):
+            return None
+        # we can only check for validity on the target if the target includes the current Python
+        #  (checked last so that only files that really are plain Python depend on the target)
+        if self.target_info < sys.version_info[:2]:
+            return None
+        return tree
+
+    def plain_python_proc(self, inputstring, tree):
+        """Stand in for the grammar on pre-processed plain Python code from plain_python_ast."""
+        # f strings don't need their expressions compiled
+        for i, (reftype, data) in enumerate(self.refs):
+            if reftype == "f_str":
+                strchar, string_parts, exprs = data
+                self.refs[i] = ("str", (interleaved_join(string_parts, exprs), strchar))
+
+        lines = inputstring.split("\n")
+        out_lines = []
+        for ln, line in enumerate(lines, 1):
+            indent, line = split_leading_indent(line)
+            base, comment = split_comment(line)
+            for comment_marker in self.comment_marker_regex.findall(comment):
+                self.comments[self.adjust(ln)].add(comment_marker)
+            # rejoin lines that were joined by ind_proc the way the grammar would
+            code = ""
+            for part in base.split(non_syntactic_newline):
+                part = part.strip()
+                if code and part and code[-1] not in open_chars and part[0] not in close_chars + ",":
+                    code += " "
+                code += part
+            if ln < len(lines):
+                code += self.wrap_line_number(ln)
+            out_lines.append(indent + code)
+
+        # move the module docstring to the header the way set_moduledoc would
+        for i, line in enumerate(out_lines):
+            code, wrapped_ln = line.partition(lnwrapper)[::2]
+            if code:
+                prefix, _, string_ref = code.partition(strwrapper)
+                if (not prefix or prefix.isalpha()) and string_ref.endswith(unwrapper) and string_ref[:-1].isdigit():
+                    self.docstring = self.reformat(code, ignore_errors=False) + "\n\n"
+                    out_lines[i] = lnwrapper + wrapped_ln
+                break
+
+        # apply TCO to every function it would be applied to in the full parse
+        if not self.no_tco:
+            src_to_ln = [self.adjust(ln) for ln in range(1, len(lines) + 1)]
+            tco_def_inds = []
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.FunctionDef):
+                    continue
+                def_ind = bisect_right(src_to_ln, node.lineno) - 1
+                end_ind = bisect_right(src_to_ln, node.end_lineno) - 1
+                raw_lines = [line + "\n" for line in out_lines[def_ind + 1:end_ind + 1]]
+                if not raw_lines:
+                    continue
+                func_code, tco, _ = self.transform_returns(
+                    inputstring,
+                    sum(len(line) + 1 for line in lines[:def_ind]),
+                    raw_lines,
+                    is_gen=self.detect_is_gen(raw_lines),
+                )
+                if tco:
+                    new_lines = func_code.split("\n")[:-1]
+                    internal_assert(len(new_lines) == len(raw_lines), "TCO changed the number of lines in", func_code)
+                    out_lines[def_ind + 1:end_ind + 1] = new_lines
+                    tco_def_inds.append(def_ind)
+            for def_ind in tco_def_inds:
+                indent, line = split_leading_indent(out_lines[def_ind])
+                out_lines[def_ind] = indent + "@_coconut_tco\n" + line
+
+        return "\n".join(out_lines)
+
     def parse(
         self,
         inputstring,
@@ -1389,12 +1838,29 @@ class Compiler(Grammar, pickleable_obj):
         keep_state=False,
         codepath=None,
         use_cache=None,
+        headerless_result=None,
     ):
         """Use the parser to parse the inputstring with appropriate setup and teardown."""
+        self.wait_for_warm_up()
         if use_cache is None:
             use_cache = USE_CACHE
         use_cache = use_cache and codepath is not None
         with self.parsing(keep_state, codepath):
+            # reused results from parse_multi_target only need a new header
+            if headerless_result is not None:
+                _, self.docstring, body = headerless_result
+                return self.apply_procs(self.headerprocs, body, **postargs)
+            # plain Python files can skip the grammar entirely
+            plain_python_tree = None
+            if parser is self.file_parser and not preargs.get("strip"):
+                plain_python_tree = self.plain_python_ast(inputstring)
+                if plain_python_tree is not None:
+                    logger.log("Using plain Python fast path.")
+                    streamline = use_cache = False
+            # the incremental parsing cache can't be shared across processes
+            in_parallel = plain_python_tree is None and self.should_parse_in_parallel(parser, inputstring, keep_state)
+            if in_parallel:
+                use_cache = False
             if streamline:
                 self.streamline(parser, inputstring)
             # unpickling must happen after streamlining and must occur in the
@@ -1408,9 +1874,13 @@ class Compiler(Grammar, pickleable_obj):
                 with logger.gather_parsing_stats():
                     try:
                         pre_procd = self.pre(inputstring, keep_state=keep_state, **preargs)
-                        if isinstance(parser, tuple):
+                        if plain_python_tree is not None:
+                            parsed = self.plain_python_proc(pre_procd, plain_python_tree)
+                        elif isinstance(parser, tuple):
                             init_parser, line_parser = parser
                             parsed = self.parse_line_by_line(init_parser, line_parser, pre_procd)
+                        elif in_parallel:
+                            parsed = self.parse_in_parallel(parser, pre_procd)
                         else:
                             parsed = parse(parser, pre_procd, inner=False)
                         out = self.post(parsed, keep_state=keep_state, **postargs)
@@ -2263,7 +2733,7 @@ else:
                     elif self.target_info < (3, 3):
                         ret_err = "_coconut.StopIteration"
                         # warn about Python 3.7 incompatibility on any target with Python 3 support
-                        if not self.target.startswith("2"):
+                        if not (2,) <= self.target_info < (3,):
                             logger.warn_err(
                                 self.make_err(
                                     CoconutSyntaxWarning,
@@ -2439,7 +2909,7 @@ except _coconut.NameError:
         # handle async functions
         if is_async:
             force_gen = False
-            if not self.target:
+            if not self.target_info:
                 raise self.make_err(
                     CoconutTargetError,
                     "async function definition requires a specific target",
@@ -2791,8 +3261,13 @@ else:
 
     def header_proc(self, inputstring, header="file", initial="initial", use_hash=None, **kwargs):
         """Add the header."""
+        # save everything but the header for parse_multi_target to reuse
+        #  with any other targets that pass the same target checks
+        self.headerless_result = (frozenset(self.target_checks), self.docstring, inputstring)
         pre_header = self.getheader(initial, use_hash=use_hash, polish=False)
         main_header = self.getheader(header, polish=False)
+        if self.tree_shake and header == "file":
+            main_header = tree_shake_header(main_header, inputstring)
         if self.minify:
             main_header = minify_header(main_header)
         return pre_header + self.docstring + main_header + inputstring
@@ -3275,7 +3750,7 @@ while True:
                 self.strict_err_or_warn("unnecessary inheriting from object (Coconut does this automatically)", original, loc)
 
             # universalize if not Python 3
-            if not self.target.startswith("3"):
+            if self.target_info < (3,):
 
                 if star_args:
                     pos_args += ["_coconut_handle_cls_stargs(" + join_args(star_args) + ")"]
@@ -3290,7 +3765,7 @@ while True:
         if paramdefs and self.target_info < (3, 12):
             base_classes.append(self.get_generic_for_typevars())
 
-        if not classlist_toks and not self.target.startswith("3"):
+        if not classlist_toks and self.target_info < (3,):
             base_classes.append("_coconut.object")
 
         out += "(" + ", ".join(base_classes) + ")" + body
@@ -3321,14 +3796,25 @@ while True:
 
         check_var = self.get_temp_var("match_check", loc)
         matcher = self.get_matcher(original, loc, check_var, name_list=[])
-        matcher.match_function_toks(matches)
+
+        # when every field is just a name with simple type checks, build the data
+        #  straight from the args and only fall back on the matcher if that fails
+        fast_path = None
+        if cond is None:
+            fast_path = match_function_fast_path_code(
+                matches,
+                loc,
+                lambda names: "return _coconut.tuple.__new__(_coconut_cls, " + tuple_str_of(names) + ")",
+            )
+
+        matcher.match_function_toks(matches, include_setup=fast_path is None)
         if cond is not None:
             matcher.add_guard(cond)
 
         extra_stmts = handle_indentation(
             '''
 def __new__(_coconut_cls, {match_func_paramdef}):
-    {check_var} = False
+    {fast_path}{check_var} = False
     {matching}
     {pattern_error}
     return _coconut.tuple.__new__(_coconut_cls, {arg_tuple})
@@ -3336,6 +3822,7 @@ def __new__(_coconut_cls, {match_func_paramdef}):
             add_newline=True,
         ).format(
             match_func_paramdef=match_func_paramdef,
+            fast_path="" if fast_path is None else match_funcdef_setup_code() + "\n" + fast_path,
             check_var=check_var,
             matching=matcher.out(),
             pattern_error=self.pattern_error(original, loc, match_to_args_var, check_var, function_match_error_var),
@@ -3435,7 +3922,7 @@ def {starred_arg}(self):
                     num_base_args=str(len(base_args)),
                     base_args_tuple=tuple_str_of(base_args),
                     quoted_base_args_tuple=tuple_str_of(base_args, add_quotes=True),
-                    kwd_only=("*, " if self.target.startswith("3") else ""),
+                    kwd_only=("*, " if self.target_info >= (3,) else ""),
                 )
             else:
                 extra_stmts += handle_indentation(
@@ -3462,7 +3949,7 @@ def {arg}(self):
                 ).format(
                     name=name,
                     arg=starred_arg,
-                    kwd_only=("*, " if self.target.startswith("3") else ""),
+                    kwd_only=("*, " if self.target_info >= (3,) else ""),
                 )
         elif arg_defaults:
             extra_stmts += handle_indentation(
@@ -3543,7 +4030,7 @@ def __new__(_coconut_cls, {all_args}):
             out += [", ", inherit]
         if paramdefs and self.target_info < (3, 12):
             out += [", ", self.get_generic_for_typevars()]
-        if not self.target.startswith("3"):
+        if self.target_info < (3,):
             out.append(", _coconut.object")
         out += [
             "):\n",
@@ -3699,11 +4186,11 @@ def __hash__(self):
 
             if old_imp is None:
                 paths = (imp,)
-            elif not self.target:  # universal compatibility
+            elif not self.target_info:  # universal compatibility
                 paths = (old_imp, imp, version_check)
             elif get_target_info_smart(self.target, mode="lowest") >= version_check:  # if lowest is above, we can safely use new
                 paths = (imp,)
-            elif self.target.startswith("2"):  # "2" and "27" can safely use old
+            elif self.target_info < (3,):  # "2" and "27" can safely use old
                 paths = (old_imp,)
             elif self.target_info < version_check:  # "3" should be compatible with all 3+
                 paths = (old_imp, imp, version_check)
@@ -3771,7 +4258,7 @@ if {store_var} is not _coconut_sentinel:
     def complex_raise_stmt_handle(self, loc, tokens):
         """Process Python 3 raise from statement."""
         raise_expr, from_expr = tokens
-        if self.target.startswith("3"):
+        if self.target_info >= (3,):
             return "raise " + raise_expr + " from " + from_expr
         else:
             return handle_indentation(
@@ -4153,7 +4640,7 @@ def {builder_name}({expr_setnames_str}):
     def await_expr_handle(self, original, loc, tokens):
         """Check for Python 3.5 await expression."""
         await_expr, = tokens
-        if not self.target:
+        if not self.target_info:
             raise self.make_err(
                 CoconutTargetError,
                 "await requires a specific target",
@@ -4214,7 +4701,7 @@ def {builder_name}({expr_setnames_str}):
         """Process Python 3 type annotations."""
         if len(tokens) == 1:  # return typedef
             typedef, = tokens
-            if self.target.startswith("3"):
+            if self.target_info >= (3,):
                 return " -> " + self.wrap_typedef(typedef, for_py_typedef=True) + ":"
             else:
                 return ":\n" + self.wrap_type_comment(typedef, is_return=True)
@@ -4226,7 +4713,7 @@ def {builder_name}({expr_setnames_str}):
                 varname, typedef, default, comma = tokens
             else:
                 raise CoconutInternalException("invalid type annotation tokens", tokens)
-            if self.target.startswith("3"):
+            if self.target_info >= (3,):
                 return varname + ": " + self.wrap_typedef(typedef, for_py_typedef=True) + default + comma
             else:
                 return varname + default + comma + self.wrap_type_comment(typedef, add_newline=True)
@@ -4274,7 +4761,7 @@ __annotations__["{name}"] = {annotation}
             )
 
     def ellipsis_handle(self, tokens=None):
-        if self.target.startswith("3"):
+        if self.target_info >= (3,):
             return "..."
         else:
             return "_coconut.Ellipsis"
@@ -5040,7 +5527,7 @@ class {protocol_var}({tokens}, _coconut.typing.Protocol): pass
             )
 
         if name == "exec":
-            if self.target.startswith("3"):
+            if self.target_info >= (3,):
                 return name
             elif assign:
                 return self.raise_or_wrap_error(
@@ -5054,7 +5541,7 @@ class {protocol_var}({tokens}, _coconut.typing.Protocol): pass
                 )
             else:
                 return "_coconut_exec"
-        elif not assign and name in super_names and not self.target.startswith("3"):
+        elif not assign and name in super_names and self.target_info < (3,):
             if self.in_method:
                 cls_context = self.current_parsing_context("class")
                 enclosing_cls = cls_context["name_prefix"] + cls_context["name"]
@@ -5232,14 +5719,95 @@ class {protocol_var}({tokens}, _coconut.typing.Protocol): pass
         """Parse xonsh code."""
         return self.parse(inputstring, self.xonsh_parser, {"strip": True}, {"header": "none", "initial": "none"}, streamline=False, **kwargs)
 
-    def warm_up(self, streamline=False, enable_incremental_mode=False, set_debug_names=False):
-        """Warm up the compiler by streamlining the file_parser."""
-        if set_debug_names:
-            self.set_grammar_names()
-        self.streamline(self.file_parser, force=streamline)
-        self.streamline(self.eval_parser, force=streamline)
-        if enable_incremental_mode:
-            enable_incremental_parsing(reason="explicit warm_up call")
+    def parse_multi_target(self, targets, method, *args, **kwargs):
+        """Compile with the given parse method (e.g. "parse_file") once for each of the given targets.
+
+        Every check made against the target while compiling is recorded, such that
+        any later target that passes all the same checks would have compiled to the
+        same code and so can reuse the existing compilation with just a new header.
+
+        Returns (dict of compiled code by target, number of full compilations,
+        time spent compiling, estimated time for compiling each target separately)."""
+        # previously cached parse results would hide any target checks they made
+        kwargs["use_cache"] = False
+        compiled_by_target = {}
+        headerless_results = []
+        total_time = separate_time = 0
+        for target in targets:
+            with self.using_target(target):
+                start_time = get_clock_time()
+                full_time = None
+                for headerless_result, result_time in headerless_results:
+                    if checks_hold_for(headerless_result[0], self._target):
+                        compiled_by_target[target] = getattr(self, method)(*args, headerless_result=headerless_result, **kwargs)
+                        full_time = result_time
+                        break
+                if full_time is None:
+                    force_reset_packrat_cache()
+                    compiled_by_target[target] = getattr(self, method)(*args, **kwargs)
+                elapsed_time = get_clock_time() - start_time
+                if full_time is None:
+                    full_time = elapsed_time
+                    headerless_results.append((self.headerless_result, full_time))
+            total_time += elapsed_time
+            separate_time += full_time
+        return compiled_by_target, len(headerless_results), total_time, separate_time
+
+    def warm_up(self, streamline=False, enable_incremental_mode=False, background=False, set_debug_names=False):
+        """Warm up the compiler by streamlining the file_parser.
+
+        If background, the warm up is done on a daemon thread that parse waits for,
+        and any error it raises is reraised by the next wait_for_warm_up."""
+        self.wait_for_warm_up()
+        if background:
+            thread = Thread(
+                target=self.run_background_warm_up,
+                args=(streamline, enable_incremental_mode, set_debug_names),
+                name="coconut-warm-up",
+            )
+            thread.daemon = True
+            Compiler.warm_up_thread = thread
+            thread.start()
+        else:
+            self.run_warm_up(streamline, enable_incremental_mode, set_debug_names)
+
+    def run_warm_up(self, streamline, enable_incremental_mode, set_debug_names):
+        """Do the work for warm_up."""
+        start_time = time.time()
+        try:
+            with self.lock:
+                if set_debug_names:
+                    self.set_grammar_names()
+                self.streamline(self.file_parser, force=streamline)
+                self.streamline(self.eval_parser, force=streamline)
+                if enable_incremental_mode:
+                    enable_incremental_parsing(reason="explicit warm_up call")
+        finally:
+            Compiler.warm_up_time = time.time() - start_time
+
+    def run_background_warm_up(self, *args):
+        """Run warm_up on a background thread, saving any error for wait_for_warm_up."""
+        try:
+            self.run_warm_up(*args)
+        except BaseException as err:
+            Compiler.warm_up_exc = err
+
+    @classmethod
+    def wait_for_warm_up(cls):
+        """Wait for any background warm_up to finish.
+
+        Returns the number of seconds spent waiting, or None if there was no background warm_up.
+        Reraises any error raised by the background warm_up."""
+        thread = cls.warm_up_thread
+        if thread is None or thread is current_thread():
+            return None
+        start_time = time.time()
+        thread.join()
+        Compiler.warm_up_thread = None
+        warm_up_exc, Compiler.warm_up_exc = Compiler.warm_up_exc, None
+        if warm_up_exc is not None:
+            raise warm_up_exc
+        return time.time() - start_time
 
 
 # end: ENDPOINTS
@@ -117,6 +117,7 @@ from coconut.compiler.util import (
     disambiguate_literal,
     any_of,
     StartOfStrGrammar,
+    tuple_str_of,
 )
 
 
@@ -624,8 +625,9 @@ def partial_arr_concat_handle(tokens):
         raise CoconutInternalException("invalid array concatenation operator function implicit partial token group", tok_grp)
 
 
-def array_literal_handle(loc, tokens):
-    """Handle multidimensional array literals."""
+def array_literal_spec(loc, tokens, leaves):
+    """Get the (dimension, subarray specs) of a multidimensional array literal,
+    adding its leaf elements to leaves and referring to them by index."""
     internal_assert(len(tokens) >= 1, "invalid array literal tokens", tokens)
 
     # find highest-level array literal seperators
@@ -646,30 +648,44 @@ def array_literal_handle(loc, tokens):
     pieces.append(tokens[prev_ind:])
 
     # get subarrays to stack
-    array_elems = []
+    subspecs = []
     for p in pieces:
         if p:
             if p[0].lstrip(";") == "":
                 raise CoconutDeferredSyntaxError("invalid initial multidimensional array separator or broken-up multidimensional array concatenation operator function", loc)
             elif len(p) > 1:
                 internal_assert(sep_level > 1, "failed to handle array literal tokens", tokens)
-                subarr_item = array_literal_handle(loc, p)
+                sub_level, sub_subspecs = array_literal_spec(loc, p, leaves)
+                subspecs.append(tuple_str_of((str(sub_level), tuple_str_of(sub_subspecs))))
             else:
-                subarr_item = p[0]
-            array_elems.append(subarr_item)
+                subspecs.append(str(len(leaves)))
+                leaves.append(p[0])
 
-    # if multidimensional array literal is only separators, compile to implicit partial
-    if not array_elems:
+    # if multidimensional array literal is only separators, there are no subarrays
+    if not subspecs:
         if len(pieces) > 2:
             raise CoconutDeferredSyntaxError("invalid empty multidimensional array literal or broken-up multidimensional array concatenation operator function", loc)
-        return "_coconut_partial(_coconut_arr_concat_op, " + str(sep_level) + ")"
+        return sep_level, None
 
     # check for initial top-level separators
     if not pieces[0]:
         raise CoconutDeferredSyntaxError("invalid initial multidimensional array separator", loc)
 
-    # build multidimensional array
-    return "_coconut_arr_concat_op(" + str(sep_level) + ", " + ", ".join(array_elems) + ")"
+    return sep_level, subspecs
+
+
+def array_literal_handle(loc, tokens):
+    """Handle multidimensional array literals."""
+    leaves = []
+    sep_level, subspecs = array_literal_spec(loc, tokens, leaves)
+
+    # if multidimensional array literal is only separators, compile to implicit partial
+    if subspecs is None:
+        return "_coconut_partial(_coconut_arr_concat_op, " + str(sep_level) + ")"
+
+    # build the whole multidimensional array in one call, passing its
+    #  structure as a constant so the runtime can dispatch just once
+    return "_coconut_arr_literal(" + str(sep_level) + ", " + tuple_str_of(subspecs) + ", " + ", ".join(leaves) + ")"
 
 
 def typedef_op_item_handle(loc, tokens):
@@ -2728,6 +2744,8 @@ class Grammar(object):
 
         whitespace_regex = compile_regex(r"\s")
 
+        comment_marker_regex = compile_regex(r"#[0-9]+" + unwrapper)
+
         def_regex = compile_regex(r"((async|addpattern|copyclosure)\s+)*def\b")
 
         yield_regex = compile_regex(r"\byield(?!\s+_coconut\.asyncio\.From)\b")
@@ -2900,6 +2918,7 @@ class Grammar(object):
 # -----------------------------------------------------------------------------------------------------------------------
 
     grammar_init_time = get_clock_time() - grammar_init_time
+    grammar_names_set = False
 
     @classmethod
     @contextmanager
@@ -2917,6 +2936,7 @@ class Grammar(object):
         for varname, val in vars(Grammar).items():
             if hasattr(val, "setName"):
                 val.setName(varname)
+        Grammar.grammar_names_set = True
 
 
 # end: TRACING
@@ -20,7 +20,10 @@ from __future__ import print_function, absolute_import, unicode_literals, divisi
 from coconut.root import *  # NOQA
 
 import os.path
+import re
+import ast
 from functools import partial
+from collections import defaultdict
 
 from coconut.root import _indent, _get_root_header
 from coconut.exceptions import CoconutInternalException
@@ -95,6 +98,142 @@ def minify_header(compiled):
     return compiled
 
 
+identifier_regex = re.compile(r"[A-Za-z_]\w*")
+
+
+def get_bound_names(stmt):
+    """Get the names bound by a top-level header statement, or None if it isn't a simple binding."""
+    if isinstance(stmt, (ast.FunctionDef, ast.ClassDef)) or type(stmt).__name__ == "AsyncFunctionDef":
+        return [stmt.name]
+    if isinstance(stmt, ast.Import):
+        return [alias.asname or alias.name.split(".", 1)[0] for alias in stmt.names]
+    if isinstance(stmt, ast.ImportFrom):
+        if stmt.module == "__future__":
+            return None
+        return [alias.asname or alias.name for alias in stmt.names]
+    if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+        targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        names = []
+        for target in targets:
+            for elt in (target.elts if isinstance(target, ast.Tuple) else [target]):
+                if not isinstance(elt, ast.Name):
+                    return None
+                names.append(elt.id)
+        return names
+    return None
+
+
+def tree_shake_header(header, code):
+    """Remove the top-level definitions in the header that code never (transitively) references.
+
+    Any identifier appearing anywhere in code (even in a string or comment)
+    is conservatively treated as used. Statements that aren't simple bindings are
+    always kept, except for expression statements and attribute assignments, which
+    are kept whenever the first header name they reference is kept. Returns the
+    header unchanged if it can't be parsed.
+    """
+    try:
+        stmts = ast.parse(header).body
+    except SyntaxError:
+        return header
+    if not stmts or not hasattr(stmts[0], "end_lineno"):
+        return header
+    lines = header.splitlines(True)
+
+    # bound_by maps names to (stmt index, tuple element index or None) pairs
+    bound_by = defaultdict(list)
+    refs_by_part = {}
+    split_stmts = set()
+    line_users = defaultdict(int)
+    for i, stmt in enumerate(stmts):
+        start = min([stmt.lineno] + [dec.lineno for dec in getattr(stmt, "decorator_list", ())])
+        for ln in range(start, stmt.end_lineno + 1):
+            line_users[ln] += 1
+        bound_names = get_bound_names(stmt)
+        if bound_names is None:
+            continue
+        if (
+            isinstance(stmt, ast.Assign)
+            and len(stmt.targets) == 1
+            and isinstance(stmt.targets[0], ast.Tuple)
+            and isinstance(stmt.value, ast.Tuple)
+            and len(stmt.targets[0].elts) == len(stmt.value.elts)
+        ):
+            split_stmts.add(i)
+            for j, (name, value) in enumerate(zip(bound_names, stmt.value.elts)):
+                bound_by[name].append((i, j))
+                refs_by_part[i, j] = identifier_regex.findall(ast.get_source_segment(header, value))
+        else:
+            for name in bound_names:
+                bound_by[name].append((i, None))
+            refs_by_part[i, None] = identifier_regex.findall("".join(lines[start - 1:stmt.end_lineno]))
+
+    # attached statements are kept iff the first header name they reference is kept
+    attached_to = defaultdict(list)
+    roots = set(identifier_regex.findall(code))
+    kept_parts = set()
+    for i, stmt in enumerate(stmts):
+        if i in split_stmts or (i, None) in refs_by_part:
+            continue
+        refs = identifier_regex.findall("".join(lines[stmt.lineno - 1:stmt.end_lineno]))
+        refs_by_part[i, None] = refs
+        if isinstance(stmt, (ast.Expr, ast.Assign, ast.AugAssign)):
+            for ref in refs:
+                if ref in bound_by and ref != "_coconut":
+                    attached_to[ref].append(i)
+                    break
+            else:
+                kept_parts.add((i, None))
+                roots.update(refs)
+        else:
+            kept_parts.add((i, None))
+            roots.update(refs)
+
+    # compute the transitive closure of the used names
+    kept_names = set()
+    to_visit = list(roots)
+    while to_visit:
+        name = to_visit.pop()
+        if name in kept_names:
+            continue
+        kept_names.add(name)
+        for part in bound_by.get(name, []) + [(i, None) for i in attached_to.get(name, [])]:
+            if part not in kept_parts:
+                kept_parts.add(part)
+                to_visit.extend(refs_by_part[part])
+
+    # rebuild the header without the unused statements
+    replacements = {}
+    for i, stmt in enumerate(stmts):
+        start = min([stmt.lineno] + [dec.lineno for dec in getattr(stmt, "decorator_list", ())])
+        if any(line_users[ln] > 1 for ln in range(start, stmt.end_lineno + 1)):
+            continue
+        if i not in split_stmts:
+            if (i, None) not in kept_parts:
+                replacements[start] = (stmt.end_lineno, "")
+        else:
+            kept_inds = [j for j in range(len(stmt.value.elts)) if (i, j) in kept_parts]
+            if len(kept_inds) < len(stmt.value.elts):
+                new_stmt = ""
+                if kept_inds:
+                    new_stmt = "{targets} = {values}\n".format(
+                        targets=", ".join(stmt.targets[0].elts[j].id for j in kept_inds),
+                        values=", ".join(ast.get_source_segment(header, stmt.value.elts[j]) for j in kept_inds),
+                    )
+                replacements[start] = (stmt.end_lineno, new_stmt)
+    out = []
+    ln = 1
+    while ln <= len(lines):
+        if ln in replacements:
+            end_ln, new_stmt = replacements[ln]
+            out.append(new_stmt)
+            ln = end_ln + 1
+        else:
+            out.append(lines[ln - 1])
+            ln += 1
+    return "".join(out)
+
+
 template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
 
 
@@ -219,16 +358,17 @@ def base_async_def(
     no_async_def,
     needs_vars={},
     decorator=None,
+    min_version=(3, 5),
     **kwargs  # no comma; breaks on <=3.5
 ):
     """Build up a universal async function definition."""
     target_info = get_target_info(target)
-    if target_info >= (3, 5):
+    if target_info >= min_version:
         out = async_def
     else:
         out = base_pycondition(
             target,
-            (3, 5),
+            min_version,
             if_ge=def_in_exec(func_name, async_def, needs_vars=needs_vars, decorator=decorator),
             if_lt=no_async_def,
         )
@@ -315,6 +455,16 @@ import pickle
             ''',
             indent=1,
         ),
+        import_shared_memory=pycondition(
+            (3, 8),
+            if_lt=r'''
+multiprocessing_shared_memory = None
+            ''',
+            if_ge=r'''
+from multiprocessing import shared_memory as multiprocessing_shared_memory
+            ''',
+            indent=1,
+        ),
         import_OrderedDict=prepare(
             r'''
 OrderedDict = collections.OrderedDict if _coconut_sys.version_info >= (2, 7) else dict
@@ -649,7 +799,7 @@ for _coconut_varname in dir(MatchError):
     #  (extra_format_dict is to keep indentation levels matching)
     extra_format_dict = dict(
         # when anything is added to this list it must also be added to *both* __coconut__ stub files
-        underscore_imports="{tco_comma}{call_set_names_comma}{handle_cls_args_comma}_namedtuple_of, _coconut, _coconut_Expected, _coconut_MatchError, _coconut_SupportsAdd, _coconut_SupportsMinus, _coconut_SupportsMul, _coconut_SupportsPow, _coconut_SupportsTruediv, _coconut_SupportsFloordiv, _coconut_SupportsMod, _coconut_SupportsAnd, _coconut_SupportsXor, _coconut_SupportsOr, _coconut_SupportsLshift, _coconut_SupportsRshift, _coconut_SupportsMatmul, _coconut_SupportsInv, _coconut_iter_getitem, _coconut_base_compose, _coconut_forward_compose, _coconut_back_compose, _coconut_forward_star_compose, _coconut_back_star_compose, _coconut_forward_dubstar_compose, _coconut_back_dubstar_compose, _coconut_pipe, _coconut_star_pipe, _coconut_dubstar_pipe, _coconut_back_pipe, _coconut_back_star_pipe, _coconut_back_dubstar_pipe, _coconut_none_pipe, _coconut_none_star_pipe, _coconut_none_dubstar_pipe, _coconut_bool_and, _coconut_bool_or, _coconut_none_coalesce, _coconut_minus, _coconut_map, _coconut_partial, _coconut_complex_partial, _coconut_get_function_match_error, _coconut_base_pattern_func, _coconut_addpattern, _coconut_sentinel, _coconut_assert, _coconut_raise, _coconut_mark_as_match, _coconut_reiterable, _coconut_self_match_types, _coconut_dict_merge, _coconut_exec, _coconut_comma_op, _coconut_arr_concat_op, _coconut_mk_anon_namedtuple, _coconut_matmul, _coconut_py_str, _coconut_flatten, _coconut_multiset, _coconut_back_none_pipe, _coconut_back_none_star_pipe, _coconut_back_none_dubstar_pipe, _coconut_forward_none_compose, _coconut_back_none_compose, _coconut_forward_none_star_compose, _coconut_back_none_star_compose, _coconut_forward_none_dubstar_compose, _coconut_back_none_dubstar_compose, _coconut_call_or_coefficient, _coconut_in, _coconut_not_in, _coconut_attritemgetter, _coconut_if_op, _coconut_CoconutWarning".format(**format_dict),
+        underscore_imports="{tco_comma}{call_set_names_comma}{handle_cls_args_comma}_namedtuple_of, _coconut, _coconut_Expected, _coconut_MatchError, _coconut_SupportsAdd, _coconut_SupportsMinus, _coconut_SupportsMul, _coconut_SupportsPow, _coconut_SupportsTruediv, _coconut_SupportsFloordiv, _coconut_SupportsMod, _coconut_SupportsAnd, _coconut_SupportsXor, _coconut_SupportsOr, _coconut_SupportsLshift, _coconut_SupportsRshift, _coconut_SupportsMatmul, _coconut_SupportsInv, _coconut_iter_getitem, _coconut_base_compose, _coconut_forward_compose, _coconut_back_compose, _coconut_forward_star_compose, _coconut_back_star_compose, _coconut_forward_dubstar_compose, _coconut_back_dubstar_compose, _coconut_pipe, _coconut_star_pipe, _coconut_dubstar_pipe, _coconut_back_pipe, _coconut_back_star_pipe, _coconut_back_dubstar_pipe, _coconut_none_pipe, _coconut_none_star_pipe, _coconut_none_dubstar_pipe, _coconut_bool_and, _coconut_bool_or, _coconut_none_coalesce, _coconut_minus, _coconut_map, _coconut_partial, _coconut_complex_partial, _coconut_get_function_match_error, _coconut_base_pattern_func, _coconut_addpattern, _coconut_sentinel, _coconut_assert, _coconut_raise, _coconut_mark_as_match, _coconut_reiterable, _coconut_self_match_types, _coconut_dict_merge, _coconut_exec, _coconut_comma_op, _coconut_arr_concat_op, _coconut_arr_literal, _coconut_mk_anon_namedtuple, _coconut_matmul, _coconut_py_str, _coconut_flatten, _coconut_multiset, _coconut_back_none_pipe, _coconut_back_none_star_pipe, _coconut_back_none_dubstar_pipe, _coconut_forward_none_compose, _coconut_back_none_compose, _coconut_forward_none_star_compose, _coconut_back_none_star_compose, _coconut_forward_none_dubstar_compose, _coconut_back_none_dubstar_compose, _coconut_call_or_coefficient, _coconut_in, _coconut_not_in, _coconut_attritemgetter, _coconut_if_op, _coconut_CoconutWarning".format(**format_dict),
         import_typing=pycondition(
             (3, 5),
             if_ge='''
@@ -766,6 +916,14 @@ asyncio_Return = StopIteration
             ''',
             indent=1,
         ),
+        set_StopAsyncIteration=pycondition(
+            (3, 5),
+            if_ge='''
+StopAsyncIteration = StopAsyncIteration
+            ''',
+            indent=1,
+            newline=True,
+        ),
         class_amap=pycondition(
             (3, 3),
             if_lt='''
@@ -851,16 +1009,28 @@ def __neg__(self):
         def_async_map=async_def(
             "async_map",
             async_def='''
-async def async_map(async_func, *iters, strict=False):
+async def async_map(async_func, *iters, strict=False, max_concurrency=None, ordered=True):
     """Map async_func over iters asynchronously using anyio."""
     import anyio
+    if max_concurrency is not None and max_concurrency < 1:
+        raise _coconut.ValueError("async_map: max_concurrency must be a positive integer or None")
+    slots = None if max_concurrency is None else anyio.Semaphore(max_concurrency)
     results = []
     async def store_func_in_of(i, args):
-        got = await async_func(*args)
-        results.extend([None] * (1 + i - _coconut.len(results)))
-        results[i] = got
+        try:
+            got = await async_func(*args)
+        finally:
+            if slots is not None:
+                slots.release()
+        if ordered:
+            results.extend([None] * (1 + i - _coconut.len(results)))
+            results[i] = got
+        else:
+            results.append(got)
     async with anyio.create_task_group() as nursery:
         for i, args in _coconut.enumerate({_coconut_}zip(*iters, strict=strict)):
+            if slots is not None:
+                await slots.acquire()
             nursery.start_soon(store_func_in_of, i, args)
     return results
             '''.format(**format_dict),
@@ -873,6 +1043,138 @@ def async_map(*args, **kwargs):
                 "{_coconut_}zip".format(**format_dict): "zip",
             },
         ),
+        def_async_imap=async_def(
+            "async_imap",
+            async_def='''
+class async_imap{object}:
+    """Map async_func over iters, which may be async iterables, asynchronously
+    using anyio, yielding results as they become available.
+
+    Iterating directly runs the calls in batches of max_concurrency (or all at once),
+    since an async generator can't keep a task group open across its yields;
+    use async with async_imap(...) as results to stream the results instead."""
+    __slots__ = ("async_func", "iters", "strict", "max_concurrency", "ordered", "_calls", "_results")
+    def __init__(self, async_func, *iters, strict=False, max_concurrency=None, ordered=True):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise _coconut.ValueError("async_imap: max_concurrency must be a positive integer or None")
+        self.async_func = async_func
+        self.iters = iters
+        self.strict = strict
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self._calls = None
+        self._results = None
+    def __repr__(self):
+        return "async_imap(%r, %s)" % (self.async_func, ", ".join(_coconut.repr(it) for it in self.iters))
+    async def _zip_iters(self):
+        if not _coconut.any(_coconut.hasattr(it, "__aiter__") for it in self.iters):
+            for args in {_coconut_}zip(*self.iters, strict=self.strict):
+                yield args
+            return
+        its = [it.__aiter__() if _coconut.hasattr(it, "__aiter__") else _coconut.iter(it) for it in self.iters]
+        while True:
+            args = []
+            for it in its:
+                try:
+                    args.append(await it.__anext__() if _coconut.hasattr(it, "__anext__") else _coconut.next(it))
+                except (_coconut.StopAsyncIteration, _coconut.StopIteration):
+                    if not self.strict:
+                        return
+                    args.append(_coconut_sentinel)
+            if _coconut.all(x is _coconut_sentinel for x in args):
+                return
+            if _coconut.any(x is _coconut_sentinel for x in args):
+                raise _coconut.ValueError("async_imap(..., strict=True) arguments have mismatched lengths")
+            yield _coconut.tuple(args)
+    def __aiter__(self):
+        return self._iter_batches()
+    async def _iter_batches(self):
+        import anyio
+        args_iter = self._zip_iters()
+        try:
+            while True:
+                batch = []
+                async for args in args_iter:
+                    batch.append(args)
+                    if _coconut.len(batch) == self.max_concurrency:
+                        break
+                if not batch:
+                    return
+                results = [None] * _coconut.len(batch) if self.ordered else []
+                async def store_func_of(i, args):
+                    got = await self.async_func(*args)
+                    if self.ordered:
+                        results[i] = got
+                    else:
+                        results.append(got)
+                async with anyio.create_task_group() as calls:
+                    for i, args in _coconut.enumerate(batch):
+                        calls.start_soon(store_func_of, i, args)
+                for got in results:
+                    yield got
+        finally:
+            await args_iter.aclose()
+    async def __aenter__(self):
+        import anyio
+        if self._calls is not None:
+            raise _coconut.RuntimeError("async_imap: cannot enter the same async_imap more than once at a time")
+        slots = None if self.max_concurrency is None else anyio.Semaphore(self.max_concurrency)
+        send_results, receive_results = anyio.create_memory_object_stream(_coconut.float("inf"))
+        async def send_func_of(i, args):
+            await send_results.send((i, await self.async_func(*args)))
+        async def start_calls():
+            args_iter = self._zip_iters()
+            try:
+                async with send_results:
+                    async with anyio.create_task_group() as calls:
+                        i = 0
+                        async for args in args_iter:
+                            if slots is not None:
+                                await slots.acquire()
+                            calls.start_soon(send_func_of, i, args)
+                            i += 1
+            finally:
+                await args_iter.aclose()
+        async def receive_all():
+            async with receive_results:
+                next_i = 0
+                waiting = {lbrace}{rbrace}
+                async for i, got in receive_results:
+                    if self.ordered:
+                        waiting[i] = got
+                        while next_i in waiting:
+                            got = waiting.pop(next_i)
+                            next_i += 1
+                            if slots is not None:
+                                slots.release()
+                            yield got
+                    else:
+                        if slots is not None:
+                            slots.release()
+                        yield got
+        self._calls = anyio.create_task_group()
+        await self._calls.__aenter__()
+        self._calls.start_soon(start_calls)
+        self._results = receive_all()
+        return self._results
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        calls, self._calls = self._calls, None
+        results, self._results = self._results, None
+        await results.aclose()
+        calls.cancel_scope.cancel(){COMMENT.cancels_any_calls_whose_results_were_never_consumed}
+        return await calls.__aexit__(exc_type, exc_val, exc_tb)
+            '''.format(**format_dict),
+            no_async_def='''
+def async_imap(*args, **kwargs):
+    """async_imap not available on Python < 3.6"""
+    raise _coconut.NameError("async_imap not available on Python < 3.6")
+            ''',
+            needs_vars={
+                "{_coconut_}zip".format(**format_dict): "zip",
+                "_coconut_sentinel": "_coconut_sentinel",
+            },
+            min_version=(3, 6),
+        ),
         def_call=pycondition(
             (3, 11),
             if_ge=r'''
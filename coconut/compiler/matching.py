@@ -113,6 +113,97 @@ if {first_arg} is not _coconut_sentinel:
     )
 
 
+def get_simple_match_checks(match):
+    """Get (name, checks) if match only binds a single name after some
+    isinstance checks on it, otherwise None. The checks refer to the item by that name."""
+    if "var" in match:
+        (setvar,) = match
+        if setvar == wildcard:
+            return None
+        return setvar, []
+    elif "paren" in match:
+        (paren_match,) = match
+        return get_simple_match_checks(paren_match)
+    elif "isinstance_is" in match:
+        isinstance_is_match, isinstance_checks = match[0], match[1:]
+        result = get_simple_match_checks(isinstance_is_match)
+        if result is None:
+            return None
+        name, checks = result
+        return name, ["_coconut.isinstance(" + name + ", " + instcheck + ")" for instcheck in isinstance_checks] + checks
+    elif "class" in match or "data_or_class" in match:
+        cls_name, class_matches = match
+        # builtin classes like int(x) just check isinstance for instances of _coconut_self_match_types
+        if cls_name in self_match_types and len(class_matches) == 1 and len(class_matches[0]) == 1:
+            result = get_simple_match_checks(class_matches[0][0])
+            if result is None:
+                return None
+            name, checks = result
+            return name, [
+                "_coconut.isinstance(" + name + ", " + cls_name + ")",
+                "_coconut.type(" + name + ") in _coconut_self_match_types",
+            ] + checks
+    return None
+
+
+def match_function_fast_path_code(
+    match_arg_toks,
+    loc,
+    get_body,
+    args=match_to_args_var,
+    kwargs=match_to_kwargs_var,
+):
+    """Get code that binds the arguments of a pattern-matching function and then runs get_body(names)
+    without going through the Matcher, or None if the patterns are more complex than names with type checks.
+
+    Must come after match_funcdef_setup_code. If the arguments don't fit, execution
+    just continues on, so the full pattern-matching code should follow."""
+    pos_only_args, req_args, default_args, star_arg, kwd_only_args, dubstar_arg = split_args_list(match_arg_toks, loc)
+    all_args = pos_only_args + req_args + default_args
+    if star_arg is not None or kwd_only_args or dubstar_arg is not None or not all_args:
+        return None
+
+    names = []
+    binds = []
+    checks = []
+    for i, arg in enumerate(all_args):
+        if isinstance(arg, tuple):
+            match, default = arg
+        else:
+            match, default = arg, None
+        item = args + "[" + str(i) + "]"
+        if default is not None:
+            if "const" not in default:
+                return None
+            default_expr, = default
+            item += " if _coconut.len(" + args + ") > " + str(i) + " else (" + default_expr + ")"
+        result = get_simple_match_checks(match)
+        if result is None:
+            return None
+        name, arg_checks = result
+        if name in names:
+            return None
+        names.append(name)
+        binds.append(name + " = " + item)
+        checks += arg_checks
+
+    num_req_args = len(pos_only_args) + len(req_args)
+    if num_req_args == len(all_args):
+        len_check = "_coconut.len(" + args + ") == " + str(num_req_args)
+    elif num_req_args:
+        len_check = str(num_req_args) + " <= _coconut.len(" + args + ") <= " + str(len(all_args))
+    else:
+        len_check = "_coconut.len(" + args + ") <= " + str(len(all_args))
+
+    code = "if not " + kwargs + " and " + len_check + ":\n"
+    code += "".join("    " + bind + "\n" for bind in binds)
+    if checks:
+        code += "    if " + " and ".join(checks) + ":\n        " + get_body(names) + "\n"
+    else:
+        code += "    " + get_body(names) + "\n"
+    return handle_indentation(code, add_newline=True)
+
+
 # -----------------------------------------------------------------------------------------------------------------------
 # MATCHER:
 # -----------------------------------------------------------------------------------------------------------------------
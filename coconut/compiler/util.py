@@ -31,12 +31,19 @@ import sys
 import os
 import re
 import ast
+import types
+import marshal
+import io
+import hmac
+import hashlib
 import inspect
 import __future__
 import itertools
 import weakref
 import datetime as dt
+from array import array
 from functools import partial, reduce
+from bisect import bisect_left
 from collections import defaultdict
 from contextlib import contextmanager
 from pprint import pformat, pprint
@@ -48,6 +55,7 @@ else:
 
 from coconut._pyparsing import (
     CPYPARSING,
+    PYPARSING_PACKAGE,
     MODERN_PYPARSING,
     USE_COMPUTATION_GRAPH,
     SUPPORTS_INCREMENTAL,
@@ -68,6 +76,7 @@ from coconut._pyparsing import (
     Empty,
     Literal,
     CaselessLiteral,
+    Word,
     Group,
     ParserElement,
     MatchFirst,
@@ -108,6 +117,7 @@ from coconut.constants import (
     supported_py3_vers,
     tabideal,
     embed_on_internal_exc,
+    targets,
     specific_targets,
     pseudo_targets,
     reserved_vars,
@@ -137,6 +147,11 @@ from coconut.constants import (
     always_keep_parse_name_prefix,
     keep_if_unchanged_parse_name_prefix,
     incremental_use_hybrid,
+    base_dir,
+    use_grammar_snapshot,
+    grammar_snapshot_dir,
+    PY38,
+    use_token_table_for_len,
 )
 from coconut.exceptions import (
     CoconutException,
@@ -665,10 +680,138 @@ def prep_grammar(grammar, for_scan, streamline=False, add_unpack=False):
     return grammar.parseWithTabs()
 
 
+class TokenTable(object):
+    """Precomputed token locations for a string being parsed, which lets
+    grammar terminals reject a location without going through the packrat cache."""
+    __slots__ = ("original", "white_chars", "token_locs", "highest_fail_loc")
+    current = None
+    last = None
+
+    def __init__(self, original, white_chars=default_whitespace_chars):
+        self.original = original
+        # pyparsing 2 stores whiteChars as a str but pyparsing 3 uses a set, so we always compare as sets
+        self.white_chars = frozenset(white_chars)
+        # token_locs[loc] is the location of the first token at or after loc
+        self.token_locs = array("l", range(len(original) + 1))
+        for white_match in re.finditer("[" + re.escape(white_chars) + "]+", original):
+            start, stop = white_match.span()
+            self.token_locs[start:stop] = array("l", [stop]) * (stop - start)
+        self.highest_fail_loc = 0
+
+    @classmethod
+    def get_highest_fail_loc(cls, original):
+        """Get the highest location at which a terminal was rejected while parsing original."""
+        for token_table in (cls.current, cls.last):
+            if token_table is not None and token_table.original == original:
+                return token_table.highest_fail_loc
+        return 0
+
+
+def should_use_token_table(text):
+    """Determine whether parsing text would benefit from a TokenTable."""
+    return not CPYPARSING and use_token_table_for_len is not None and len(text) > use_token_table_for_len
+
+
+@contextmanager
+def using_token_table(text):
+    """Use a TokenTable for text if it is long enough to benefit."""
+    if not should_use_token_table(text):
+        yield
+        return
+    old_token_table, TokenTable.current = TokenTable.current, TokenTable(text)
+    try:
+        yield
+    finally:
+        TokenTable.last, TokenTable.current = TokenTable.current, old_token_table
+
+
+class TokenTableTerminal(object):
+    """Mixin for grammar terminals that can use the current TokenTable to fail without touching the packrat cache.
+    Subclasses must define cannot_match(instring, preloc) such that it is only true when parseImpl would fail at preloc."""
+    normalized_white_chars = (None, None)
+
+    def _parse(self, instring, loc, doActions=True, callPreParse=True):
+        token_table = TokenTable.current
+        if (
+            token_table is not None
+            and token_table.original is instring
+            and not (self.ignoreExprs or self.debug or self.failAction)
+        ):
+            if not (callPreParse and self.callPreparse and self.skipWhitespace):
+                preloc = loc
+            else:
+                white_chars, normalized_white_chars = self.normalized_white_chars
+                if white_chars is not self.whiteChars:
+                    white_chars, normalized_white_chars = self.normalized_white_chars = (self.whiteChars, frozenset(self.whiteChars))
+                if normalized_white_chars == token_table.white_chars:
+                    preloc = token_table.token_locs[loc]
+                else:
+                    preloc = None
+            if preloc is not None and preloc < len(instring) and self.cannot_match(instring, preloc):
+                # the packrat cache would have recorded a failure at loc
+                if loc > token_table.highest_fail_loc:
+                    token_table.highest_fail_loc = loc
+                raise ParseException(instring, preloc, self.errmsg, self)
+        return ParserElement._parse(self, instring, loc, doActions, callPreParse)
+
+
+# maps pyparsing terminal classes to their TokenTableTerminal subclasses
+token_table_terminal_classes = {}
+
+
+def add_token_table_fast_path(base_cls, cannot_match):
+    """Create TokenTableTerminal subclasses of base_cls and all its subclasses (that don't already have one) using cannot_match."""
+    to_visit = [base_cls]
+    while to_visit:
+        cls = to_visit.pop()
+        if cls in token_table_terminal_classes or issubclass(cls, TokenTableTerminal):
+            continue
+        to_visit.extend(cls.__subclasses__())
+        name = str("TokenTable" + cls.__name__.lstrip("_"))
+        new_cls = type(name, (TokenTableTerminal, cls), {
+            "__module__": __name__,
+            "cannot_match": cannot_match,
+        })
+        # put the new class in this module so that grammar snapshots can pickle it by reference
+        globals()[name] = new_cls
+        token_table_terminal_classes[cls] = new_cls
+
+
+if not CPYPARSING:
+    # these mirror the first check in each class's parseImpl (CaselessLiteral subclasses Literal so must come first)
+    add_token_table_fast_path(CaselessLiteral, lambda self, instring, loc: instring[loc:loc + self.matchLen].upper() != self.match)
+    add_token_table_fast_path(Literal, lambda self, instring, loc: instring[loc] != self.firstMatchChar or not instring.startswith(self.match, loc))
+    add_token_table_fast_path(Word, lambda self, instring, loc: instring[loc] not in self.initChars)
+    add_token_table_fast_path(Regex, lambda self, instring, loc: not self.re_match(instring, loc))
+
+
+def enable_token_table_for(grammar):
+    """Switch all the terminals in grammar to their TokenTableTerminal subclasses.
+    Only the grammar's own elements are changed, rather than the pyparsing classes themselves."""
+    if grammar.__dict__.get("token_table_enabled"):
+        return
+    seen = set()
+    to_visit = [grammar]
+    while to_visit:
+        elem = to_visit.pop()
+        if elem is None or id(elem) in seen:
+            continue
+        seen.add(id(elem))
+        new_cls = token_table_terminal_classes.get(elem.__class__)
+        if new_cls is not None:
+            elem.__class__ = new_cls
+        to_visit.append(getattr(elem, "expr", None))
+        to_visit.extend(getattr(elem, "exprs", ()))
+    grammar.token_table_enabled = True
+
+
 def parse(grammar, text, inner=None, eval_parse_tree=True):
     """Parse text using grammar."""
-    with parsing_context(inner):
-        result = prep_grammar(grammar, for_scan=False).parseString(text)
+    with parsing_context(inner), using_token_table(text):
+        grammar = prep_grammar(grammar, for_scan=False)
+        if should_use_token_table(text):
+            enable_token_table_for(grammar)
+        result = grammar.parseString(text)
         if eval_parse_tree:
             result = unpack(result)
         return result
@@ -758,6 +901,30 @@ def get_psf_target():
     return pseudo_targets.get(ver, ver)
 
 
+def normalize_target(target):
+    """Convert a user-specified target into its canonical form."""
+    if target is None:
+        target = ""
+    else:
+        target = str(target)
+    if len(target) > 1 and target[1] == ".":
+        target = target[:1] + target[2:]
+    if "." in target:
+        raise CoconutException("target Python version must be major.minor, not major.minor.micro")
+    if target == "sys":
+        target = sys_target
+    elif target == "psf":
+        target = get_psf_target()
+    if target in pseudo_targets:
+        target = pseudo_targets[target]
+    if target not in targets:
+        raise CoconutException(
+            "unsupported target Python version " + repr(target),
+            extra="supported targets are: " + ", ".join(repr(t) for t in specific_targets + tuple(pseudo_targets)) + ", 'sys', 'psf'",
+        )
+    return target
+
+
 def get_vers_for_target(target):
     """Gets a list of the versions supported by the given target."""
     target_info = get_target_info(target)
@@ -805,6 +972,77 @@ def get_target_info_smart(target, mode="lowest"):
         raise CoconutInternalException("unknown get_target_info_smart mode", mode)
 
 
+class RecordingTargetInfo(tuple):
+    """Target info version tuple that records every check made against it.
+
+    Each check is added to checks as (method name, args, result) such that
+    checks_hold_for can later tell whether another target would have given
+    the same results. Any use other than a comparison or truth test records
+    an equality check, which only holds for the exact same target."""
+
+    def __new__(cls, target_info, checks):
+        self = tuple.__new__(cls, target_info)
+        self.checks = checks
+        return self
+
+    def record_check(self, method_name, *args):
+        """Run and record a tuple method on this target info."""
+        result = getattr(tuple, method_name)(self, *args)
+        self.checks.add((method_name, args, result))
+        return result
+
+    def depend_fully(self):
+        """Record that the exact target matters."""
+        self.checks.add(("__eq__", (tuple.__add__(self, ()),), True))
+
+    def __lt__(self, other):
+        return self.record_check("__lt__", tuple(other))
+
+    def __le__(self, other):
+        return self.record_check("__le__", tuple(other))
+
+    def __gt__(self, other):
+        return self.record_check("__gt__", tuple(other))
+
+    def __ge__(self, other):
+        return self.record_check("__ge__", tuple(other))
+
+    def __eq__(self, other):
+        return self.record_check("__eq__", tuple(other))
+
+    def __ne__(self, other):
+        return self.record_check("__ne__", tuple(other))
+
+    def __len__(self):
+        return self.record_check("__len__")
+
+    def __hash__(self):
+        self.depend_fully()
+        return tuple.__hash__(self)
+
+    def __iter__(self):
+        self.depend_fully()
+        return tuple.__iter__(self)
+
+    def __getitem__(self, index):
+        self.depend_fully()
+        return tuple.__getitem__(self, index)
+
+    def __contains__(self, item):
+        self.depend_fully()
+        return tuple.__contains__(self, item)
+
+    def __add__(self, other):
+        self.depend_fully()
+        return tuple.__add__(self, other)
+
+
+def checks_hold_for(checks, target):
+    """Determine whether the given RecordingTargetInfo checks give the same results for target."""
+    target_info = get_target_info(target)
+    return all(getattr(tuple, method_name)(target_info, *args) == result for method_name, args, result in checks)
+
+
 # -----------------------------------------------------------------------------------------------------------------------
 # PARSING INTROSPECTION:
 # -----------------------------------------------------------------------------------------------------------------------
@@ -1027,7 +1265,7 @@ def get_cache_items_for(original, only_useful=False, exclude_stale=True):
 def get_highest_parse_loc(original):
     """Get the highest observed parse location.
     Note that there's no point in filtering for successes/failures, since we always see both at the same locations."""
-    highest_loc = 0
+    highest_loc = TokenTable.get_highest_fail_loc(original)
     for lookup, _ in get_cache_items_for(original):
         loc = lookup[_lookup_loc]
         if loc > highest_loc:
@@ -1259,6 +1497,221 @@ def get_cache_path(codepath):
     return os.path.join(cache_dir, pickle_fname)
 
 
+def get_grammar_snapshot_key():
+    """Get the key that grammar snapshots for the current Coconut installation, pyparsing, and Python are authenticated with."""
+    compiler_dir = os.path.join(base_dir, "compiler")
+    source_paths = [
+        os.path.join(base_dir, "_pyparsing.py"),
+        os.path.join(base_dir, "constants.py"),
+    ] + [
+        os.path.join(compiler_dir, fname)
+        for fname in sorted(os.listdir(compiler_dir))
+        if fname.endswith(".py")
+    ]
+    grammar_data = [
+        str((
+            VERSION,
+            base_dir,
+            sys.implementation.name,
+            sys.version_info,
+            pyparsing_version,
+            USE_COMPUTATION_GRAPH,
+            use_adaptive_any_of,
+            reverse_any_of,
+            use_fast_pyparsing_reprs,
+        )).encode("utf-8"),
+    ]
+    for path in source_paths:
+        with univ_open(path, "rb") as source_file:
+            grammar_data.append(source_file.read())
+    return hashlib.sha256(b"\0".join(grammar_data)).digest()
+
+
+def get_grammar_snapshot_path(snapshot_key):
+    """Get the grammar snapshot filename for the given snapshot key."""
+    snapshot_fname = "grammar-{coconut_version}-{py_impl}{py_ver}-pyparsing{pyparsing_version}-{grammar_hash}.pkl".format(
+        coconut_version=VERSION,
+        py_impl=sys.implementation.name,
+        py_ver="".join(str(v) for v in sys.version_info[:2]),
+        pyparsing_version=pyparsing_version,
+        grammar_hash=hashlib.sha256(snapshot_key).hexdigest()[:16],
+    )
+    return os.path.join(grammar_snapshot_dir, snapshot_fname)
+
+
+def sign_grammar_snapshot(snapshot_key, data):
+    """Compute the signature that authenticates the given grammar snapshot data."""
+    return hmac.new(snapshot_key, data, hashlib.sha256).digest()
+
+
+if PY38:
+    class _EmptyCell(object):
+        """Marker for closure cells with no contents."""
+    _empty_cell = _EmptyCell()
+
+    def _make_function(code, module, name, defaults, num_cells, qualname):
+        """Recreate a function pickled by value by _GrammarPickler."""
+        func = types.FunctionType(
+            marshal.loads(code),
+            sys.modules[module].__dict__,
+            name,
+            defaults,
+            tuple(types.CellType() for _ in range(num_cells)),
+        )
+        func.__qualname__ = qualname
+        return func
+
+    def _set_function_state(func, state):
+        """Fill in the closure of a function recreated by _make_function.
+        Done as a separate step so that closures can refer back to the function itself."""
+        cell_contents, kwdefaults, func_dict = state
+        for cell, contents in zip(func.__closure__ or (), cell_contents):
+            if contents is not _empty_cell:
+                cell.cell_contents = contents
+        func.__kwdefaults__ = kwdefaults
+        func.__dict__.update(func_dict)
+        return func
+
+    class _GrammarPickler(pickle.Pickler, object):
+        """Pickler for grammar snapshots. Module-level objects are pickled by
+        reference and the grammar's closures and lambdas are pickled by value."""
+        by_reference_excluded_types = (
+            str,
+            bytes,
+            int,
+            float,
+            bool,
+            type(None),
+            tuple,
+            frozenset,
+            types.ModuleType,
+            type,
+            types.FunctionType,
+            types.BuiltinFunctionType,
+            # grammar elements must always be copied so the snapshot keeps them streamlined
+            ParserElement,
+        )
+
+        def __init__(self, *args, **kwargs):
+            super(_GrammarPickler, self).__init__(*args, **kwargs)
+            self.references_by_id = {}
+            for modname, mod in list(sys.modules.items()):
+                if mod is None or modname.split(".", 1)[0] not in ("coconut", PYPARSING_PACKAGE):
+                    continue
+                for attr, val in list(vars(mod).items()):
+                    if isinstance(val, type) and val.__module__ == modname:
+                        for cls_attr, cls_val in vars(val).items():
+                            self.add_reference(cls_val, modname, attr + "." + cls_attr)
+                    self.add_reference(val, modname, attr)
+
+        def add_reference(self, obj, modname, path):
+            """Pickle obj by reference to modname.path."""
+            if not isinstance(obj, self.by_reference_excluded_types):
+                self.references_by_id.setdefault(id(obj), (modname, path))
+
+        def persistent_id(self, obj):
+            """Get the reference to use for obj, if any."""
+            return self.references_by_id.get(id(obj))
+
+        def reducer_override(self, obj):
+            """Pickle functions that can't be found by name by value."""
+            if not isinstance(obj, types.FunctionType):
+                return NotImplemented
+            try:
+                found = sys.modules[obj.__module__]
+                for attr in obj.__qualname__.split("."):
+                    found = getattr(found, attr)
+            except (KeyError, AttributeError):
+                pass
+            else:
+                if found is obj:
+                    return NotImplemented
+            cell_contents = []
+            for cell in obj.__closure__ or ():
+                try:
+                    cell_contents.append(cell.cell_contents)
+                except ValueError:
+                    cell_contents.append(_empty_cell)
+            return (
+                _make_function,
+                # functools.wraps copies __module__, so the globals' __name__ must be used instead
+                (marshal.dumps(obj.__code__), obj.__globals__["__name__"], obj.__name__, obj.__defaults__, len(cell_contents), obj.__qualname__),
+                (tuple(cell_contents), obj.__kwdefaults__, dict(obj.__dict__)),
+                None,
+                None,
+                _set_function_state,
+            )
+
+    class _GrammarUnpickler(pickle.Unpickler, object):
+        """Unpickler for grammar snapshots written by _GrammarPickler."""
+
+        def persistent_load(self, pid):
+            """Resolve a reference written by _GrammarPickler.persistent_id."""
+            modname, path = pid
+            obj = sys.modules[modname]
+            for attr in path.split("."):
+                obj = getattr(obj, attr)
+            return obj
+
+
+def can_use_grammar_snapshot():
+    """Determine whether grammar snapshots can be used."""
+    # cPyparsing's cache identifies elements by creation order, which snapshot copies don't share
+    return PY38 and use_grammar_snapshot and all_parse_elements is None
+
+
+def save_grammar_snapshot(grammars, snapshot_path, snapshot_key):
+    """Save a snapshot of the given streamlined grammars to snapshot_path, signed with snapshot_key."""
+    internal_assert(can_use_grammar_snapshot(), "save_grammar_snapshot requires grammar snapshots to be enabled")
+    try:
+        snapshot_buffer = io.BytesIO()
+        _GrammarPickler(snapshot_buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(grammars)
+        data = snapshot_buffer.getvalue()
+        snapshot_dir = os.path.dirname(snapshot_path)
+        if not os.path.exists(snapshot_dir):
+            os.makedirs(snapshot_dir, mode=0o700)
+        temp_path = snapshot_path + ".{pid}.tmp".format(pid=os.getpid())
+        with univ_open(temp_path, "wb") as snapshot_file:
+            snapshot_file.write(sign_grammar_snapshot(snapshot_key, data) + data)
+        os.replace(temp_path, snapshot_path)
+    except Exception:
+        logger.log_exc()
+        return False
+    else:
+        logger.log("Saved grammar snapshot to {path!r}.".format(path=snapshot_path))
+        return True
+
+
+def load_grammar_snapshot(snapshot_path, snapshot_key, num_grammars):
+    """Load the streamlined grammars saved to snapshot_path, or None if unavailable.
+    The snapshot is only unpickled if it is owned by the current user, isn't
+    writable by anyone else, and has a valid signature for snapshot_key."""
+    internal_assert(can_use_grammar_snapshot(), "load_grammar_snapshot requires grammar snapshots to be enabled")
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        snapshot_stat = os.stat(snapshot_path)
+        if hasattr(os, "getuid") and (snapshot_stat.st_uid != os.getuid() or snapshot_stat.st_mode & 0o022):
+            logger.log("Ignoring grammar snapshot at {path!r} not exclusively writable by the current user.".format(path=snapshot_path))
+            return None
+        with univ_open(snapshot_path, "rb") as snapshot_file:
+            signed_data = snapshot_file.read()
+        signature_len = hashlib.sha256().digest_size
+        signature, data = signed_data[:signature_len], signed_data[signature_len:]
+        if not hmac.compare_digest(signature, sign_grammar_snapshot(snapshot_key, data)):
+            logger.log("Ignoring grammar snapshot at {path!r} with invalid signature.".format(path=snapshot_path))
+            return None
+        grammars = _GrammarUnpickler(io.BytesIO(data)).load()
+    except Exception:
+        logger.log_exc()
+        return None
+    if not isinstance(grammars, list) or len(grammars) != num_grammars:
+        logger.log("Ignoring invalid grammar snapshot at {path!r}.".format(path=snapshot_path))
+        return None
+    logger.log("Loaded grammar snapshot from {path!r}.".format(path=snapshot_path))
+    return grammars
+
+
 # -----------------------------------------------------------------------------------------------------------------------
 # PARSE ELEMENTS:
 # -----------------------------------------------------------------------------------------------------------------------
@@ -1776,6 +2229,67 @@ def getline(loc, original):
     return _line(loc, original.replace(non_syntactic_newline, "\n"))
 
 
+def map_nested(obj, func):
+    """Apply func to every non-container item nested inside of tuples, lists, and dicts in obj."""
+    if isinstance(obj, tuple):
+        return tuple(map_nested(item, func) for item in obj)
+    elif isinstance(obj, list):
+        return [map_nested(item, func) for item in obj]
+    elif isinstance(obj, dict):
+        return obj.__class__((map_nested(key, func), map_nested(val, func)) for key, val in obj.items())
+    else:
+        return func(obj)
+
+
+class OriginalPlaceholder(object):
+    """Stands in for the original string being parsed when sending parse results between processes."""
+    __slots__ = ()
+
+
+def split_top_level_chunks(original, num_chunks, min_chunk_len=0):
+    """Get (start, stop) bounds that split processed code into at most num_chunks
+    chunks of complete top-level statements."""
+    split_locs = []
+    depth = 0
+    after_decorator = False
+    loc = 0
+    for line in original.split("\n"):
+        stripped = line.lstrip(openindent + closeindent)
+        indent_markers = line[:len(line) - len(stripped)]
+        depth += indent_markers.count(openindent) - indent_markers.count(closeindent)
+        if stripped:
+            # new chunks must start at a top-level statement, never in the middle of
+            #  an if/try/etc. chain or after a decorator, and never at a string or comment
+            #  since those could be mistaken for a module docstring
+            first_word = stripped.split(None, 1)[0].rstrip(":")
+            if (
+                loc > 0
+                and depth == 0
+                and not after_decorator
+                and (stripped[0].isalpha() or stripped[0] == "_")
+                and first_word not in ("else", "elif", "except", "except*", "finally", "case")
+            ):
+                split_locs.append(loc + len(indent_markers))
+            if not stripped.startswith("#"):
+                after_decorator = stripped.startswith("@")
+        loc += len(line) + 1
+
+    bounds = []
+    start = 0
+    for i in range(1, num_chunks):
+        target_loc = max(len(original) * i // num_chunks, start + min_chunk_len)
+        split_ind = bisect_left(split_locs, target_loc)
+        if split_ind >= len(split_locs):
+            break
+        stop = split_locs[split_ind]
+        if len(original) - stop < min_chunk_len:
+            break
+        bounds.append((start, stop))
+        start = stop
+    bounds.append((start, len(original)))
+    return bounds
+
+
 def powerset(items, min_len=0):
     """Return the powerset of the given items."""
     return itertools.chain.from_iterable(
@@ -139,6 +139,13 @@ packrat_cache_size = None  # only works because final() clears the cache
 
 streamline_grammar_for_len = 1536
 
+# None to disable; only used without cPyparsing
+use_token_table_for_len = 1536
+
+# only used with --parallel-parse
+parallel_parse_min_chunk_len = 4096
+parallel_parse_chunks_per_worker = 2
+
 use_pyparsing_cache_file = True
 
 adaptive_any_of_env_var = "COCONUT_ADAPTIVE_ANY_OF"
@@ -644,6 +651,7 @@ more_prompt = "    "
 
 default_use_cache_dir = get_bool_env_var("COCONUT_USE_CACHE_DIR", PY34)
 coconut_cache_dir = "__coconut_cache__"
+import_record_ext = ".import_record.json"
 
 mypy_path_env_var = "MYPYPATH"
 
@@ -684,6 +692,15 @@ installed_stub_dir = os.path.join(coconut_home, ".coconut_stubs")
 
 pyright_config_file = os.path.join(coconut_home, ".coconut_pyrightconfig.json")
 
+# opt-in since snapshots contain pickled code; also requires Pickler.reducer_override, which was added in 3.8
+use_grammar_snapshot_env_var = "COCONUT_USE_GRAMMAR_SNAPSHOT"
+use_grammar_snapshot = get_bool_env_var(use_grammar_snapshot_env_var, False)
+grammar_snapshot_dir_env_var = "COCONUT_GRAMMAR_SNAPSHOT_DIR"
+grammar_snapshot_dir = get_path_env_var(
+    grammar_snapshot_dir_env_var,
+    os.path.join(coconut_home, ".coconut_grammar"),
+)
+
 watch_interval = .1  # seconds
 
 info_tabulation = 18  # offset for tabulated info messages
@@ -823,11 +840,13 @@ coconut_specific_builtins = (
     "multi_enumerate",
     "cartesian_product",
     "multiset",
+    "data_array",
     "cycle",
     "windowsof",
     "and_then",
     "and_then_await",
     "async_map",
+    "async_imap",
     "py_chr",
     "py_dict",
     "py_hex",
@@ -65,7 +65,7 @@ def load_ipython_extension(ipython):
 
     magic_state = api.get_state()
     api.setup(state=magic_state, **coconut_kernel_kwargs)
-    api.warm_up(enable_incremental_mode=True, state=magic_state)
+    api.warm_up(enable_incremental_mode=True, background=True, state=magic_state)
 
     # add magic function
     def magic(line, cell=None):
@@ -110,6 +110,12 @@ class CoconutXontribLoader(object):
         from coconut.util import get_clock_time
         from coconut.terminal import logger
 
+        # the first compile has to wait for the background warm up started in __call__
+        warm_up_wait_time = self.compiler.wait_for_warm_up()
+        if warm_up_wait_time is not None:
+            self.timing_info.append(("warm_up", self.compiler.warm_up_time))
+            self.timing_info.append(("warm_up_wait", warm_up_wait_time))
+
         parse_start_time = get_clock_time()
         quiet, logger.quiet = logger.quiet, True
         success = False
@@ -202,7 +208,7 @@ class CoconutXontribLoader(object):
         if self.compiler is None:
             from coconut.compiler import Compiler
             self.compiler = Compiler(**coconut_kernel_kwargs)
-            self.compiler.warm_up(enable_incremental_mode=interpreter_uses_incremental)
+            self.compiler.warm_up(enable_incremental_mode=interpreter_uses_incremental, background=True)
 
         if self.runner is None:
             from coconut.command.util import Runner
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# __coconut_hash__ = 0x4a0a5ca1
+
+# Compiled with Coconut version 3.1.2
+
+# Coconut Header: -------------------------------------------------------------
+
+from __future__ import generator_stop
+import sys as _coconut_sys
+import os as _coconut_os
+_coconut_header_info = ('3.1.2', '35', False)
+_coconut_cached__coconut__ = _coconut_sys.modules.get('__coconut__')
+_coconut_file_dir = _coconut_os.path.dirname(_coconut_os.path.abspath(__file__))
+_coconut_pop_path = False
+if _coconut_cached__coconut__ is None or getattr(_coconut_cached__coconut__, "_coconut_header_info", None) != _coconut_header_info and _coconut_os.path.dirname(_coconut_cached__coconut__.__file__ or "") != _coconut_file_dir:  # type: ignore
+    if _coconut_cached__coconut__ is not None:
+        _coconut_sys.modules['_coconut_cached__coconut__'] = _coconut_cached__coconut__
+        del _coconut_sys.modules['__coconut__']
+    _coconut_sys.path.insert(0, _coconut_file_dir)
+    _coconut_pop_path = True
+    _coconut_module_name = _coconut_os.path.splitext(_coconut_os.path.basename(_coconut_file_dir))[0]
+    if _coconut_module_name and _coconut_module_name[0].isalpha() and all(c.isalpha() or c.isdigit() for c in _coconut_module_name) and "__init__.py" in _coconut_os.listdir(_coconut_file_dir):  # type: ignore
+        _coconut_full_module_name = str(_coconut_module_name + ".__coconut__")  # type: ignore
+        import __coconut__ as _coconut__coconut__
+        _coconut__coconut__.__name__ = _coconut_full_module_name
+        for _coconut_v in vars(_coconut__coconut__).values():  # type: ignore
+            if getattr(_coconut_v, "__module__", None) == '__coconut__':  # type: ignore
+                try:
+                    _coconut_v.__module__ = _coconut_full_module_name
+                except AttributeError:
+                    _coconut_v_type = type(_coconut_v)  # type: ignore
+                    if getattr(_coconut_v_type, "__module__", None) == '__coconut__':  # type: ignore
+                        _coconut_v_type.__module__ = _coconut_full_module_name
+        _coconut_sys.modules[_coconut_full_module_name] = _coconut__coconut__
+from __coconut__ import *
+from __coconut__ import _coconut_tail_call, _coconut_tco, _coconut_call_set_names, _namedtuple_of, _coconut, _coconut_Expected, _coconut_MatchError, _coconut_SupportsAdd, _coconut_SupportsMinus, _coconut_SupportsMul, _coconut_SupportsPow, _coconut_SupportsTruediv, _coconut_SupportsFloordiv, _coconut_SupportsMod, _coconut_SupportsAnd, _coconut_SupportsXor, _coconut_SupportsOr, _coconut_SupportsLshift, _coconut_SupportsRshift, _coconut_SupportsMatmul, _coconut_SupportsInv, _coconut_iter_getitem, _coconut_base_compose, _coconut_forward_compose, _coconut_back_compose, _coconut_forward_star_compose, _coconut_back_star_compose, _coconut_forward_dubstar_compose, _coconut_back_dubstar_compose, _coconut_pipe, _coconut_star_pipe, _coconut_dubstar_pipe, _coconut_back_pipe, _coconut_back_star_pipe, _coconut_back_dubstar_pipe, _coconut_none_pipe, _coconut_none_star_pipe, _coconut_none_dubstar_pipe, _coconut_bool_and, _coconut_bool_or, _coconut_none_coalesce, _coconut_minus, _coconut_map, _coconut_partial, _coconut_complex_partial, _coconut_get_function_match_error, _coconut_base_pattern_func, _coconut_addpattern, _coconut_sentinel, _coconut_assert, _coconut_raise, _coconut_mark_as_match, _coconut_reiterable, _coconut_self_match_types, _coconut_dict_merge, _coconut_exec, _coconut_comma_op, _coconut_arr_concat_op, _coconut_arr_literal, _coconut_mk_anon_namedtuple, _coconut_matmul, _coconut_py_str, _coconut_flatten, _coconut_multiset, _coconut_back_none_pipe, _coconut_back_none_star_pipe, _coconut_back_none_dubstar_pipe, _coconut_forward_none_compose, _coconut_back_none_compose, _coconut_forward_none_star_compose, _coconut_back_none_star_compose, _coconut_forward_none_dubstar_compose, _coconut_back_none_dubstar_compose, _coconut_call_or_coefficient, _coconut_in, _coconut_not_in, _coconut_attritemgetter, _coconut_if_op, _coconut_CoconutWarning
+if _coconut_pop_path:
+    _coconut_sys.path.pop(0)
+try:
+    __file__ = _coconut_os.path.abspath(__file__) if __file__ else __file__
+except NameError:
+    pass
+else:
+    if __file__ and '__coconut_cache__' in __file__:
+        _coconut_file_comps = []
+        while __file__:
+            __file__, _coconut_file_comp = _coconut_os.path.split(__file__)
+            if not _coconut_file_comp:
+                _coconut_file_comps.append(__file__)
+                break
+            if _coconut_file_comp != '__coconut_cache__':
+                _coconut_file_comps.append(_coconut_file_comp)
+        __file__ = _coconut_os.path.join(*reversed(_coconut_file_comps))
+
+# Compiled Coconut: -----------------------------------------------------------
+
+import asyncio  #1 (line in Coconut source)
+if _coconut.typing.TYPE_CHECKING:  #1 (line in Coconut source)
+    import typing  #1 (line in Coconut source)
+else:  #1 (line in Coconut source)
+    try:  #1 (line in Coconut source)
+        typing = _coconut.typing  #1 (line in Coconut source)
+    except _coconut.AttributeError as _coconut_imp_err:  #1 (line in Coconut source)
+        raise _coconut.ImportError(_coconut.str(_coconut_imp_err))  #1 (line in Coconut source)
+try:  #2 (line in Coconut source)
+    _coconut_sys_0 = sys  # type: ignore  #2 (line in Coconut source)
+except _coconut.NameError:  #2 (line in Coconut source)
+    _coconut_sys_0 = _coconut_sentinel  #2 (line in Coconut source)
+sys = _coconut_sys  #2 (line in Coconut source)
+if sys.version_info >= (3, 10):  #2 (line in Coconut source)
+    from contextlib import aclosing  #2 (line in Coconut source)
+else:  #2 (line in Coconut source)
+    from async_generator import aclosing  #2 (line in Coconut source)
+if _coconut_sys_0 is not _coconut_sentinel:  #2 (line in Coconut source)
+    sys = _coconut_sys_0  #2 (line in Coconut source)
+
+
+def py35_test() -> 'bool':  #5 (line in Coconut source)
+    """Performs Python-3.5-specific tests."""  #6 (line in Coconut source)
+    assert (repr)(_coconut.operator.attrgetter("attr")) == "operator.attrgetter('attr')"  #7 (line in Coconut source)
+    assert (repr)(_coconut.operator.methodcaller("method", 1)) == "operator.methodcaller('method', 1)"  #8 (line in Coconut source)
+    assert (repr)(_coconut_partial(pow, 1)) == "functools.partial(<built-in function pow>, 1)"  #9 (line in Coconut source)
+    assert (repr)(_coconut.operator.itemgetter((1))) == "operator.itemgetter(1)"  #10 (line in Coconut source)
+
+    loop = asyncio.new_event_loop()  #12 (line in Coconut source)
+
+    async def ayield(x):  #14 (line in Coconut source)
+        return (x)  #14 (line in Coconut source)
+
+    @_coconut.async_generator.async_generator  #15 (line in Coconut source)
+    async def arange(n):  #15 (line in Coconut source)
+        for i in (range(n)):  #16 (line in Coconut source)
+            await _coconut.async_generator.yield_((await ayield(i)))  #17 (line in Coconut source)
+
+    async def afor_test():  #18 (line in Coconut source)
+# match syntax 1
+        got = []  #20 (line in Coconut source)
+        async for _coconut_match_to_0 in (arange(5)):  #21 (line in Coconut source)
+            _coconut_match_check_0 = False  #21 (line in Coconut source)
+            _coconut_match_temp_0 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #21 (line in Coconut source)
+            _coconut_match_check_0 = True  #21 (line in Coconut source)
+            if _coconut_match_check_0:  #21 (line in Coconut source)
+                _coconut_match_check_0 = False  #21 (line in Coconut source)
+                if not _coconut_match_check_0:  #21 (line in Coconut source)
+                    _coconut_match_set_name_i = _coconut_sentinel  #21 (line in Coconut source)
+                    if (_coconut_match_temp_0) and (_coconut.isinstance(_coconut_match_to_0, int)) and (_coconut.len(_coconut_match_to_0) >= 1):  #21 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_match_to_0[0]  #21 (line in Coconut source)
+                        _coconut_match_temp_1 = _coconut.len(_coconut_match_to_0) <= _coconut.max(1, _coconut.len(_coconut_match_to_0.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_0, "_coconut_data_defaults", {}) and _coconut_match_to_0[i] == _coconut.getattr(_coconut_match_to_0, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_0.__match_args__))) if _coconut.hasattr(_coconut_match_to_0, "__match_args__") else _coconut.len(_coconut_match_to_0) == 1  # type: ignore  #21 (line in Coconut source)
+                        if _coconut_match_temp_1:  #21 (line in Coconut source)
+                            _coconut_match_check_0 = True  #21 (line in Coconut source)
+                    if _coconut_match_check_0:  #21 (line in Coconut source)
+                        if _coconut_match_set_name_i is not _coconut_sentinel:  #21 (line in Coconut source)
+                            i = _coconut_match_set_name_i  #21 (line in Coconut source)
+
+                if not _coconut_match_check_0:  #21 (line in Coconut source)
+                    if (not _coconut_match_temp_0) and (_coconut.isinstance(_coconut_match_to_0, int)):  #21 (line in Coconut source)
+                        _coconut_match_check_0 = True  #21 (line in Coconut source)
+                    if _coconut_match_check_0:  #21 (line in Coconut source)
+                        _coconut_match_check_0 = False  #21 (line in Coconut source)
+                        if not _coconut_match_check_0:  #21 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #21 (line in Coconut source)
+                            if _coconut.type(_coconut_match_to_0) in _coconut_self_match_types:  #21 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_match_to_0  #21 (line in Coconut source)
+                                _coconut_match_check_0 = True  #21 (line in Coconut source)
+                            if _coconut_match_check_0:  #21 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #21 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #21 (line in Coconut source)
+
+                        if not _coconut_match_check_0:  #21 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #21 (line in Coconut source)
+                            if not _coconut.type(_coconut_match_to_0) in _coconut_self_match_types:  #21 (line in Coconut source)
+                                _coconut_match_temp_2 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #21 (line in Coconut source)
+                                if not _coconut.isinstance(_coconut_match_temp_2, _coconut.tuple):  #21 (line in Coconut source)
+                                    raise _coconut.TypeError("int.__match_args__ must be a tuple")  #21 (line in Coconut source)
+                                if _coconut.len(_coconut_match_temp_2) < 1:  #21 (line in Coconut source)
+                                    raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_2),))  #21 (line in Coconut source)
+                                _coconut_match_temp_3 = _coconut.getattr(_coconut_match_to_0, _coconut_match_temp_2[0], _coconut_sentinel)  #21 (line in Coconut source)
+                                if _coconut_match_temp_3 is not _coconut_sentinel:  #21 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_temp_3  #21 (line in Coconut source)
+                                    _coconut_match_check_0 = True  #21 (line in Coconut source)
+                            if _coconut_match_check_0:  #21 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #21 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #21 (line in Coconut source)
+
+
+
+
+
+            if not _coconut_match_check_0:  #21 (line in Coconut source)
+                raise _coconut_MatchError('async for int(i) in arange(5):', _coconut_match_to_0)  #21 (line in Coconut source)
+
+
+            got.append(i)  #22 (line in Coconut source)
+
+        assert got == (list)(range(5))  #23 (line in Coconut source)
+
+# match syntax 2
+        got = []  #26 (line in Coconut source)
+        async for _coconut_match_to_1 in (arange(5)):  #27 (line in Coconut source)
+            _coconut_match_check_1 = False  #27 (line in Coconut source)
+            _coconut_match_temp_4 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #27 (line in Coconut source)
+            _coconut_match_check_1 = True  #27 (line in Coconut source)
+            if _coconut_match_check_1:  #27 (line in Coconut source)
+                _coconut_match_check_1 = False  #27 (line in Coconut source)
+                if not _coconut_match_check_1:  #27 (line in Coconut source)
+                    _coconut_match_set_name_i = _coconut_sentinel  #27 (line in Coconut source)
+                    if (_coconut_match_temp_4) and (_coconut.isinstance(_coconut_match_to_1, int)) and (_coconut.len(_coconut_match_to_1) >= 1):  #27 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_match_to_1[0]  #27 (line in Coconut source)
+                        _coconut_match_temp_5 = _coconut.len(_coconut_match_to_1) <= _coconut.max(1, _coconut.len(_coconut_match_to_1.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_1, "_coconut_data_defaults", {}) and _coconut_match_to_1[i] == _coconut.getattr(_coconut_match_to_1, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_1.__match_args__))) if _coconut.hasattr(_coconut_match_to_1, "__match_args__") else _coconut.len(_coconut_match_to_1) == 1  # type: ignore  #27 (line in Coconut source)
+                        if _coconut_match_temp_5:  #27 (line in Coconut source)
+                            _coconut_match_check_1 = True  #27 (line in Coconut source)
+                    if _coconut_match_check_1:  #27 (line in Coconut source)
+                        if _coconut_match_set_name_i is not _coconut_sentinel:  #27 (line in Coconut source)
+                            i = _coconut_match_set_name_i  #27 (line in Coconut source)
+
+                if not _coconut_match_check_1:  #27 (line in Coconut source)
+                    if (not _coconut_match_temp_4) and (_coconut.isinstance(_coconut_match_to_1, int)):  #27 (line in Coconut source)
+                        _coconut_match_check_1 = True  #27 (line in Coconut source)
+                    if _coconut_match_check_1:  #27 (line in Coconut source)
+                        _coconut_match_check_1 = False  #27 (line in Coconut source)
+                        if not _coconut_match_check_1:  #27 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #27 (line in Coconut source)
+                            if _coconut.type(_coconut_match_to_1) in _coconut_self_match_types:  #27 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_match_to_1  #27 (line in Coconut source)
+                                _coconut_match_check_1 = True  #27 (line in Coconut source)
+                            if _coconut_match_check_1:  #27 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #27 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #27 (line in Coconut source)
+
+                        if not _coconut_match_check_1:  #27 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #27 (line in Coconut source)
+                            if not _coconut.type(_coconut_match_to_1) in _coconut_self_match_types:  #27 (line in Coconut source)
+                                _coconut_match_temp_6 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #27 (line in Coconut source)
+                                if not _coconut.isinstance(_coconut_match_temp_6, _coconut.tuple):  #27 (line in Coconut source)
+                                    raise _coconut.TypeError("int.__match_args__ must be a tuple")  #27 (line in Coconut source)
+                                if _coconut.len(_coconut_match_temp_6) < 1:  #27 (line in Coconut source)
+                                    raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_6),))  #27 (line in Coconut source)
+                                _coconut_match_temp_7 = _coconut.getattr(_coconut_match_to_1, _coconut_match_temp_6[0], _coconut_sentinel)  #27 (line in Coconut source)
+                                if _coconut_match_temp_7 is not _coconut_sentinel:  #27 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_temp_7  #27 (line in Coconut source)
+                                    _coconut_match_check_1 = True  #27 (line in Coconut source)
+                            if _coconut_match_check_1:  #27 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #27 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #27 (line in Coconut source)
+
+
+
+
+
+            if not _coconut_match_check_1:  #27 (line in Coconut source)
+                raise _coconut_MatchError('async match for int(i) in arange(5):', _coconut_match_to_1)  #27 (line in Coconut source)
+
+
+            got.append(i)  #28 (line in Coconut source)
+
+        assert got == (list)(range(5))  #29 (line in Coconut source)
+
+# match syntax 3
+        got = []  #32 (line in Coconut source)
+        async for _coconut_match_to_2 in (arange(5)):  #33 (line in Coconut source)
+            _coconut_match_check_2 = False  #33 (line in Coconut source)
+            _coconut_match_temp_8 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #33 (line in Coconut source)
+            _coconut_match_check_2 = True  #33 (line in Coconut source)
+            if _coconut_match_check_2:  #33 (line in Coconut source)
+                _coconut_match_check_2 = False  #33 (line in Coconut source)
+                if not _coconut_match_check_2:  #33 (line in Coconut source)
+                    _coconut_match_set_name_i = _coconut_sentinel  #33 (line in Coconut source)
+                    if (_coconut_match_temp_8) and (_coconut.isinstance(_coconut_match_to_2, int)) and (_coconut.len(_coconut_match_to_2) >= 1):  #33 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_match_to_2[0]  #33 (line in Coconut source)
+                        _coconut_match_temp_9 = _coconut.len(_coconut_match_to_2) <= _coconut.max(1, _coconut.len(_coconut_match_to_2.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_2, "_coconut_data_defaults", {}) and _coconut_match_to_2[i] == _coconut.getattr(_coconut_match_to_2, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_2.__match_args__))) if _coconut.hasattr(_coconut_match_to_2, "__match_args__") else _coconut.len(_coconut_match_to_2) == 1  # type: ignore  #33 (line in Coconut source)
+                        if _coconut_match_temp_9:  #33 (line in Coconut source)
+                            _coconut_match_check_2 = True  #33 (line in Coconut source)
+                    if _coconut_match_check_2:  #33 (line in Coconut source)
+                        if _coconut_match_set_name_i is not _coconut_sentinel:  #33 (line in Coconut source)
+                            i = _coconut_match_set_name_i  #33 (line in Coconut source)
+
+                if not _coconut_match_check_2:  #33 (line in Coconut source)
+                    if (not _coconut_match_temp_8) and (_coconut.isinstance(_coconut_match_to_2, int)):  #33 (line in Coconut source)
+                        _coconut_match_check_2 = True  #33 (line in Coconut source)
+                    if _coconut_match_check_2:  #33 (line in Coconut source)
+                        _coconut_match_check_2 = False  #33 (line in Coconut source)
+                        if not _coconut_match_check_2:  #33 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #33 (line in Coconut source)
+                            if _coconut.type(_coconut_match_to_2) in _coconut_self_match_types:  #33 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_match_to_2  #33 (line in Coconut source)
+                                _coconut_match_check_2 = True  #33 (line in Coconut source)
+                            if _coconut_match_check_2:  #33 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #33 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #33 (line in Coconut source)
+
+                        if not _coconut_match_check_2:  #33 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_sentinel  #33 (line in Coconut source)
+                            if not _coconut.type(_coconut_match_to_2) in _coconut_self_match_types:  #33 (line in Coconut source)
+                                _coconut_match_temp_10 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #33 (line in Coconut source)
+                                if not _coconut.isinstance(_coconut_match_temp_10, _coconut.tuple):  #33 (line in Coconut source)
+                                    raise _coconut.TypeError("int.__match_args__ must be a tuple")  #33 (line in Coconut source)
+                                if _coconut.len(_coconut_match_temp_10) < 1:  #33 (line in Coconut source)
+                                    raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_10),))  #33 (line in Coconut source)
+                                _coconut_match_temp_11 = _coconut.getattr(_coconut_match_to_2, _coconut_match_temp_10[0], _coconut_sentinel)  #33 (line in Coconut source)
+                                if _coconut_match_temp_11 is not _coconut_sentinel:  #33 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_temp_11  #33 (line in Coconut source)
+                                    _coconut_match_check_2 = True  #33 (line in Coconut source)
+                            if _coconut_match_check_2:  #33 (line in Coconut source)
+                                if _coconut_match_set_name_i is not _coconut_sentinel:  #33 (line in Coconut source)
+                                    i = _coconut_match_set_name_i  #33 (line in Coconut source)
+
+
+
+
+
+            if not _coconut_match_check_2:  #33 (line in Coconut source)
+                raise _coconut_MatchError('match async for int(i) in arange(5):', _coconut_match_to_2)  #33 (line in Coconut source)
+
+
+            got.append(i)  #34 (line in Coconut source)
+
+        assert got == (list)(range(5))  #35 (line in Coconut source)
+
+# with for non-match
+        got = []  #38 (line in Coconut source)
+        async with aclosing(arange(5)) as _coconut_async_with_for_0:  #39 (line in Coconut source)
+            async for i in _coconut_async_with_for_0:  #39 (line in Coconut source)
+
+                got.append(i)  #40 (line in Coconut source)
+        assert got == (list)(range(5))  #41 (line in Coconut source)
+
+# with for match syntax 1
+        got = []  #44 (line in Coconut source)
+        async with aclosing(arange(5)) as _coconut_async_with_for_1:  #45 (line in Coconut source)
+            async for _coconut_match_to_3 in _coconut_async_with_for_1:  #45 (line in Coconut source)
+                _coconut_match_check_3 = False  #45 (line in Coconut source)
+                _coconut_match_temp_12 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #45 (line in Coconut source)
+                _coconut_match_check_3 = True  #45 (line in Coconut source)
+                if _coconut_match_check_3:  #45 (line in Coconut source)
+                    _coconut_match_check_3 = False  #45 (line in Coconut source)
+                    if not _coconut_match_check_3:  #45 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_sentinel  #45 (line in Coconut source)
+                        if (_coconut_match_temp_12) and (_coconut.isinstance(_coconut_match_to_3, int)) and (_coconut.len(_coconut_match_to_3) >= 1):  #45 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_match_to_3[0]  #45 (line in Coconut source)
+                            _coconut_match_temp_13 = _coconut.len(_coconut_match_to_3) <= _coconut.max(1, _coconut.len(_coconut_match_to_3.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_3, "_coconut_data_defaults", {}) and _coconut_match_to_3[i] == _coconut.getattr(_coconut_match_to_3, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_3.__match_args__))) if _coconut.hasattr(_coconut_match_to_3, "__match_args__") else _coconut.len(_coconut_match_to_3) == 1  # type: ignore  #45 (line in Coconut source)
+                            if _coconut_match_temp_13:  #45 (line in Coconut source)
+                                _coconut_match_check_3 = True  #45 (line in Coconut source)
+                        if _coconut_match_check_3:  #45 (line in Coconut source)
+                            if _coconut_match_set_name_i is not _coconut_sentinel:  #45 (line in Coconut source)
+                                i = _coconut_match_set_name_i  #45 (line in Coconut source)
+
+                    if not _coconut_match_check_3:  #45 (line in Coconut source)
+                        if (not _coconut_match_temp_12) and (_coconut.isinstance(_coconut_match_to_3, int)):  #45 (line in Coconut source)
+                            _coconut_match_check_3 = True  #45 (line in Coconut source)
+                        if _coconut_match_check_3:  #45 (line in Coconut source)
+                            _coconut_match_check_3 = False  #45 (line in Coconut source)
+                            if not _coconut_match_check_3:  #45 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #45 (line in Coconut source)
+                                if _coconut.type(_coconut_match_to_3) in _coconut_self_match_types:  #45 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_to_3  #45 (line in Coconut source)
+                                    _coconut_match_check_3 = True  #45 (line in Coconut source)
+                                if _coconut_match_check_3:  #45 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #45 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #45 (line in Coconut source)
+
+                            if not _coconut_match_check_3:  #45 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #45 (line in Coconut source)
+                                if not _coconut.type(_coconut_match_to_3) in _coconut_self_match_types:  #45 (line in Coconut source)
+                                    _coconut_match_temp_14 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #45 (line in Coconut source)
+                                    if not _coconut.isinstance(_coconut_match_temp_14, _coconut.tuple):  #45 (line in Coconut source)
+                                        raise _coconut.TypeError("int.__match_args__ must be a tuple")  #45 (line in Coconut source)
+                                    if _coconut.len(_coconut_match_temp_14) < 1:  #45 (line in Coconut source)
+                                        raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_14),))  #45 (line in Coconut source)
+                                    _coconut_match_temp_15 = _coconut.getattr(_coconut_match_to_3, _coconut_match_temp_14[0], _coconut_sentinel)  #45 (line in Coconut source)
+                                    if _coconut_match_temp_15 is not _coconut_sentinel:  #45 (line in Coconut source)
+                                        _coconut_match_set_name_i = _coconut_match_temp_15  #45 (line in Coconut source)
+                                        _coconut_match_check_3 = True  #45 (line in Coconut source)
+                                if _coconut_match_check_3:  #45 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #45 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #45 (line in Coconut source)
+
+
+
+
+
+                if not _coconut_match_check_3:  #45 (line in Coconut source)
+                    raise _coconut_MatchError('async with for int(i) in aclosing(arange(5)):', _coconut_match_to_3)  #45 (line in Coconut source)
+
+
+                got.append(i)  #46 (line in Coconut source)
+
+        assert got == (list)(range(5))  #47 (line in Coconut source)
+
+# with for match syntax 2
+        got = []  #50 (line in Coconut source)
+        async with aclosing(arange(5)) as _coconut_async_with_for_2:  #51 (line in Coconut source)
+            async for _coconut_match_to_4 in _coconut_async_with_for_2:  #51 (line in Coconut source)
+                _coconut_match_check_4 = False  #51 (line in Coconut source)
+                _coconut_match_temp_16 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #51 (line in Coconut source)
+                _coconut_match_check_4 = True  #51 (line in Coconut source)
+                if _coconut_match_check_4:  #51 (line in Coconut source)
+                    _coconut_match_check_4 = False  #51 (line in Coconut source)
+                    if not _coconut_match_check_4:  #51 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_sentinel  #51 (line in Coconut source)
+                        if (_coconut_match_temp_16) and (_coconut.isinstance(_coconut_match_to_4, int)) and (_coconut.len(_coconut_match_to_4) >= 1):  #51 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_match_to_4[0]  #51 (line in Coconut source)
+                            _coconut_match_temp_17 = _coconut.len(_coconut_match_to_4) <= _coconut.max(1, _coconut.len(_coconut_match_to_4.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_4, "_coconut_data_defaults", {}) and _coconut_match_to_4[i] == _coconut.getattr(_coconut_match_to_4, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_4.__match_args__))) if _coconut.hasattr(_coconut_match_to_4, "__match_args__") else _coconut.len(_coconut_match_to_4) == 1  # type: ignore  #51 (line in Coconut source)
+                            if _coconut_match_temp_17:  #51 (line in Coconut source)
+                                _coconut_match_check_4 = True  #51 (line in Coconut source)
+                        if _coconut_match_check_4:  #51 (line in Coconut source)
+                            if _coconut_match_set_name_i is not _coconut_sentinel:  #51 (line in Coconut source)
+                                i = _coconut_match_set_name_i  #51 (line in Coconut source)
+
+                    if not _coconut_match_check_4:  #51 (line in Coconut source)
+                        if (not _coconut_match_temp_16) and (_coconut.isinstance(_coconut_match_to_4, int)):  #51 (line in Coconut source)
+                            _coconut_match_check_4 = True  #51 (line in Coconut source)
+                        if _coconut_match_check_4:  #51 (line in Coconut source)
+                            _coconut_match_check_4 = False  #51 (line in Coconut source)
+                            if not _coconut_match_check_4:  #51 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #51 (line in Coconut source)
+                                if _coconut.type(_coconut_match_to_4) in _coconut_self_match_types:  #51 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_to_4  #51 (line in Coconut source)
+                                    _coconut_match_check_4 = True  #51 (line in Coconut source)
+                                if _coconut_match_check_4:  #51 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #51 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #51 (line in Coconut source)
+
+                            if not _coconut_match_check_4:  #51 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #51 (line in Coconut source)
+                                if not _coconut.type(_coconut_match_to_4) in _coconut_self_match_types:  #51 (line in Coconut source)
+                                    _coconut_match_temp_18 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #51 (line in Coconut source)
+                                    if not _coconut.isinstance(_coconut_match_temp_18, _coconut.tuple):  #51 (line in Coconut source)
+                                        raise _coconut.TypeError("int.__match_args__ must be a tuple")  #51 (line in Coconut source)
+                                    if _coconut.len(_coconut_match_temp_18) < 1:  #51 (line in Coconut source)
+                                        raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_18),))  #51 (line in Coconut source)
+                                    _coconut_match_temp_19 = _coconut.getattr(_coconut_match_to_4, _coconut_match_temp_18[0], _coconut_sentinel)  #51 (line in Coconut source)
+                                    if _coconut_match_temp_19 is not _coconut_sentinel:  #51 (line in Coconut source)
+                                        _coconut_match_set_name_i = _coconut_match_temp_19  #51 (line in Coconut source)
+                                        _coconut_match_check_4 = True  #51 (line in Coconut source)
+                                if _coconut_match_check_4:  #51 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #51 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #51 (line in Coconut source)
+
+
+
+
+
+                if not _coconut_match_check_4:  #51 (line in Coconut source)
+                    raise _coconut_MatchError('async match with for int(i) in aclosing(arange(5)):', _coconut_match_to_4)  #51 (line in Coconut source)
+
+
+                got.append(i)  #52 (line in Coconut source)
+
+        assert got == (list)(range(5))  #53 (line in Coconut source)
+
+# with for match syntax 3
+        got = []  #56 (line in Coconut source)
+        async with aclosing(arange(5)) as _coconut_async_with_for_3:  #57 (line in Coconut source)
+            async for _coconut_match_to_5 in _coconut_async_with_for_3:  #57 (line in Coconut source)
+                _coconut_match_check_5 = False  #57 (line in Coconut source)
+                _coconut_match_temp_20 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #57 (line in Coconut source)
+                _coconut_match_check_5 = True  #57 (line in Coconut source)
+                if _coconut_match_check_5:  #57 (line in Coconut source)
+                    _coconut_match_check_5 = False  #57 (line in Coconut source)
+                    if not _coconut_match_check_5:  #57 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_sentinel  #57 (line in Coconut source)
+                        if (_coconut_match_temp_20) and (_coconut.isinstance(_coconut_match_to_5, int)) and (_coconut.len(_coconut_match_to_5) >= 1):  #57 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_match_to_5[0]  #57 (line in Coconut source)
+                            _coconut_match_temp_21 = _coconut.len(_coconut_match_to_5) <= _coconut.max(1, _coconut.len(_coconut_match_to_5.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_5, "_coconut_data_defaults", {}) and _coconut_match_to_5[i] == _coconut.getattr(_coconut_match_to_5, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_5.__match_args__))) if _coconut.hasattr(_coconut_match_to_5, "__match_args__") else _coconut.len(_coconut_match_to_5) == 1  # type: ignore  #57 (line in Coconut source)
+                            if _coconut_match_temp_21:  #57 (line in Coconut source)
+                                _coconut_match_check_5 = True  #57 (line in Coconut source)
+                        if _coconut_match_check_5:  #57 (line in Coconut source)
+                            if _coconut_match_set_name_i is not _coconut_sentinel:  #57 (line in Coconut source)
+                                i = _coconut_match_set_name_i  #57 (line in Coconut source)
+
+                    if not _coconut_match_check_5:  #57 (line in Coconut source)
+                        if (not _coconut_match_temp_20) and (_coconut.isinstance(_coconut_match_to_5, int)):  #57 (line in Coconut source)
+                            _coconut_match_check_5 = True  #57 (line in Coconut source)
+                        if _coconut_match_check_5:  #57 (line in Coconut source)
+                            _coconut_match_check_5 = False  #57 (line in Coconut source)
+                            if not _coconut_match_check_5:  #57 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #57 (line in Coconut source)
+                                if _coconut.type(_coconut_match_to_5) in _coconut_self_match_types:  #57 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_to_5  #57 (line in Coconut source)
+                                    _coconut_match_check_5 = True  #57 (line in Coconut source)
+                                if _coconut_match_check_5:  #57 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #57 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #57 (line in Coconut source)
+
+                            if not _coconut_match_check_5:  #57 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #57 (line in Coconut source)
+                                if not _coconut.type(_coconut_match_to_5) in _coconut_self_match_types:  #57 (line in Coconut source)
+                                    _coconut_match_temp_22 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #57 (line in Coconut source)
+                                    if not _coconut.isinstance(_coconut_match_temp_22, _coconut.tuple):  #57 (line in Coconut source)
+                                        raise _coconut.TypeError("int.__match_args__ must be a tuple")  #57 (line in Coconut source)
+                                    if _coconut.len(_coconut_match_temp_22) < 1:  #57 (line in Coconut source)
+                                        raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_22),))  #57 (line in Coconut source)
+                                    _coconut_match_temp_23 = _coconut.getattr(_coconut_match_to_5, _coconut_match_temp_22[0], _coconut_sentinel)  #57 (line in Coconut source)
+                                    if _coconut_match_temp_23 is not _coconut_sentinel:  #57 (line in Coconut source)
+                                        _coconut_match_set_name_i = _coconut_match_temp_23  #57 (line in Coconut source)
+                                        _coconut_match_check_5 = True  #57 (line in Coconut source)
+                                if _coconut_match_check_5:  #57 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #57 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #57 (line in Coconut source)
+
+
+
+
+
+                if not _coconut_match_check_5:  #57 (line in Coconut source)
+                    raise _coconut_MatchError('match async with for int(i) in aclosing(arange(5)):', _coconut_match_to_5)  #57 (line in Coconut source)
+
+
+                got.append(i)  #58 (line in Coconut source)
+
+        assert got == (list)(range(5))  #59 (line in Coconut source)
+
+# with for match syntax 4
+        got = []  #62 (line in Coconut source)
+        async with aclosing(arange(5)) as _coconut_async_with_for_4:  #63 (line in Coconut source)
+            async for _coconut_match_to_6 in _coconut_async_with_for_4:  #63 (line in Coconut source)
+                _coconut_match_check_6 = False  #63 (line in Coconut source)
+                _coconut_match_temp_24 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #63 (line in Coconut source)
+                _coconut_match_check_6 = True  #63 (line in Coconut source)
+                if _coconut_match_check_6:  #63 (line in Coconut source)
+                    _coconut_match_check_6 = False  #63 (line in Coconut source)
+                    if not _coconut_match_check_6:  #63 (line in Coconut source)
+                        _coconut_match_set_name_i = _coconut_sentinel  #63 (line in Coconut source)
+                        if (_coconut_match_temp_24) and (_coconut.isinstance(_coconut_match_to_6, int)) and (_coconut.len(_coconut_match_to_6) >= 1):  #63 (line in Coconut source)
+                            _coconut_match_set_name_i = _coconut_match_to_6[0]  #63 (line in Coconut source)
+                            _coconut_match_temp_25 = _coconut.len(_coconut_match_to_6) <= _coconut.max(1, _coconut.len(_coconut_match_to_6.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_to_6, "_coconut_data_defaults", {}) and _coconut_match_to_6[i] == _coconut.getattr(_coconut_match_to_6, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_to_6.__match_args__))) if _coconut.hasattr(_coconut_match_to_6, "__match_args__") else _coconut.len(_coconut_match_to_6) == 1  # type: ignore  #63 (line in Coconut source)
+                            if _coconut_match_temp_25:  #63 (line in Coconut source)
+                                _coconut_match_check_6 = True  #63 (line in Coconut source)
+                        if _coconut_match_check_6:  #63 (line in Coconut source)
+                            if _coconut_match_set_name_i is not _coconut_sentinel:  #63 (line in Coconut source)
+                                i = _coconut_match_set_name_i  #63 (line in Coconut source)
+
+                    if not _coconut_match_check_6:  #63 (line in Coconut source)
+                        if (not _coconut_match_temp_24) and (_coconut.isinstance(_coconut_match_to_6, int)):  #63 (line in Coconut source)
+                            _coconut_match_check_6 = True  #63 (line in Coconut source)
+                        if _coconut_match_check_6:  #63 (line in Coconut source)
+                            _coconut_match_check_6 = False  #63 (line in Coconut source)
+                            if not _coconut_match_check_6:  #63 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #63 (line in Coconut source)
+                                if _coconut.type(_coconut_match_to_6) in _coconut_self_match_types:  #63 (line in Coconut source)
+                                    _coconut_match_set_name_i = _coconut_match_to_6  #63 (line in Coconut source)
+                                    _coconut_match_check_6 = True  #63 (line in Coconut source)
+                                if _coconut_match_check_6:  #63 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #63 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #63 (line in Coconut source)
+
+                            if not _coconut_match_check_6:  #63 (line in Coconut source)
+                                _coconut_match_set_name_i = _coconut_sentinel  #63 (line in Coconut source)
+                                if not _coconut.type(_coconut_match_to_6) in _coconut_self_match_types:  #63 (line in Coconut source)
+                                    _coconut_match_temp_26 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #63 (line in Coconut source)
+                                    if not _coconut.isinstance(_coconut_match_temp_26, _coconut.tuple):  #63 (line in Coconut source)
+                                        raise _coconut.TypeError("int.__match_args__ must be a tuple")  #63 (line in Coconut source)
+                                    if _coconut.len(_coconut_match_temp_26) < 1:  #63 (line in Coconut source)
+                                        raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_26),))  #63 (line in Coconut source)
+                                    _coconut_match_temp_27 = _coconut.getattr(_coconut_match_to_6, _coconut_match_temp_26[0], _coconut_sentinel)  #63 (line in Coconut source)
+                                    if _coconut_match_temp_27 is not _coconut_sentinel:  #63 (line in Coconut source)
+                                        _coconut_match_set_name_i = _coconut_match_temp_27  #63 (line in Coconut source)
+                                        _coconut_match_check_6 = True  #63 (line in Coconut source)
+                                if _coconut_match_check_6:  #63 (line in Coconut source)
+                                    if _coconut_match_set_name_i is not _coconut_sentinel:  #63 (line in Coconut source)
+                                        i = _coconut_match_set_name_i  #63 (line in Coconut source)
+
+
+
+
+
+                if not _coconut_match_check_6:  #63 (line in Coconut source)
+                    raise _coconut_MatchError('async with match for int(i) in aclosing(arange(5)):', _coconut_match_to_6)  #63 (line in Coconut source)
+
+
+                got.append(i)  #64 (line in Coconut source)
+
+        assert got == (list)(range(5))  #65 (line in Coconut source)
+
+        return (True)  #67 (line in Coconut source)
+
+    loop.run_until_complete(afor_test())  #68 (line in Coconut source)
+
+    @_coconut.async_generator.async_generator  #70 (line in Coconut source)
+    async def toa(it):  #70 (line in Coconut source)
+        for x in (it):  #71 (line in Coconut source)
+            await _coconut.async_generator.yield_((x))  #72 (line in Coconut source)
+        if False:  #73 (line in Coconut source)
+            await _coconut.async_generator.yield_()  #73 (line in Coconut source)
+
+    @_coconut.async_generator.async_generator  #73 (line in Coconut source)
+    @_coconut_mark_as_match  #73 (line in Coconut source)
+    async def arange_(_coconut_match_first_arg=_coconut_sentinel, *_coconut_match_args, **_coconut_match_kwargs):  #73 (line in Coconut source)
+        _coconut_match_check_7 = False  #73 (line in Coconut source)
+        _coconut_FunctionMatchError = _coconut_get_function_match_error()  #73 (line in Coconut source)
+        if _coconut_match_first_arg is not _coconut_sentinel:  #73 (line in Coconut source)
+            _coconut_match_args = (_coconut_match_first_arg,) + _coconut_match_args  #73 (line in Coconut source)
+        if (_coconut.len(_coconut_match_args) <= 1) and (_coconut.sum((_coconut.len(_coconut_match_args) > 0, "n" in _coconut_match_kwargs)) == 1):  #73 (line in Coconut source)
+            _coconut_match_temp_28 = _coconut_match_args[0] if _coconut.len(_coconut_match_args) > 0 else _coconut_match_kwargs.pop("n")  #73 (line in Coconut source)
+            _coconut_match_temp_29 = _coconut.getattr(int, "_coconut_is_data", False) or _coconut.isinstance(int, _coconut.tuple) and _coconut.all(_coconut.getattr(_coconut_x, "_coconut_is_data", False) for _coconut_x in int)  # type: ignore  #73 (line in Coconut source)
+            if not _coconut_match_kwargs:  #73 (line in Coconut source)
+                _coconut_match_check_7 = True  #73 (line in Coconut source)
+        if _coconut_match_check_7:  #73 (line in Coconut source)
+            _coconut_match_check_7 = False  #73 (line in Coconut source)
+            if not _coconut_match_check_7:  #73 (line in Coconut source)
+                _coconut_match_set_name_n = _coconut_sentinel  #73 (line in Coconut source)
+                if (_coconut_match_temp_29) and (_coconut.isinstance(_coconut_match_temp_28, int)) and (_coconut.len(_coconut_match_temp_28) >= 1):  #73 (line in Coconut source)
+                    _coconut_match_set_name_n = _coconut_match_temp_28[0]  #73 (line in Coconut source)
+                    _coconut_match_temp_30 = _coconut.len(_coconut_match_temp_28) <= _coconut.max(1, _coconut.len(_coconut_match_temp_28.__match_args__)) and _coconut.all(i in _coconut.getattr(_coconut_match_temp_28, "_coconut_data_defaults", {}) and _coconut_match_temp_28[i] == _coconut.getattr(_coconut_match_temp_28, "_coconut_data_defaults", {})[i] for i in _coconut.range(1, _coconut.len(_coconut_match_temp_28.__match_args__))) if _coconut.hasattr(_coconut_match_temp_28, "__match_args__") else _coconut.len(_coconut_match_temp_28) == 1  # type: ignore  #73 (line in Coconut source)
+                    if _coconut_match_temp_30:  #73 (line in Coconut source)
+                        _coconut_match_check_7 = True  #73 (line in Coconut source)
+                if _coconut_match_check_7:  #73 (line in Coconut source)
+                    if _coconut_match_set_name_n is not _coconut_sentinel:  #73 (line in Coconut source)
+                        n = _coconut_match_set_name_n  #73 (line in Coconut source)
+
+            if not _coconut_match_check_7:  #73 (line in Coconut source)
+                if (not _coconut_match_temp_29) and (_coconut.isinstance(_coconut_match_temp_28, int)):  #73 (line in Coconut source)
+                    _coconut_match_check_7 = True  #73 (line in Coconut source)
+                if _coconut_match_check_7:  #73 (line in Coconut source)
+                    _coconut_match_check_7 = False  #73 (line in Coconut source)
+                    if not _coconut_match_check_7:  #73 (line in Coconut source)
+                        _coconut_match_set_name_n = _coconut_sentinel  #73 (line in Coconut source)
+                        if _coconut.type(_coconut_match_temp_28) in _coconut_self_match_types:  #73 (line in Coconut source)
+                            _coconut_match_set_name_n = _coconut_match_temp_28  #73 (line in Coconut source)
+                            _coconut_match_check_7 = True  #73 (line in Coconut source)
+                        if _coconut_match_check_7:  #73 (line in Coconut source)
+                            if _coconut_match_set_name_n is not _coconut_sentinel:  #73 (line in Coconut source)
+                                n = _coconut_match_set_name_n  #73 (line in Coconut source)
+
+                    if not _coconut_match_check_7:  #73 (line in Coconut source)
+                        _coconut_match_set_name_n = _coconut_sentinel  #73 (line in Coconut source)
+                        if not _coconut.type(_coconut_match_temp_28) in _coconut_self_match_types:  #73 (line in Coconut source)
+                            _coconut_match_temp_31 = _coconut.getattr(int, '__match_args__', ())  # type: _coconut.typing.Any  # type: ignore  #73 (line in Coconut source)
+                            if not _coconut.isinstance(_coconut_match_temp_31, _coconut.tuple):  #73 (line in Coconut source)
+                                raise _coconut.TypeError("int.__match_args__ must be a tuple")  #73 (line in Coconut source)
+                            if _coconut.len(_coconut_match_temp_31) < 1:  #73 (line in Coconut source)
+                                raise _coconut.TypeError("too many positional args in class match (pattern requires 1; 'int' only supports %s)" % (_coconut.len(_coconut_match_temp_31),))  #73 (line in Coconut source)
+                            _coconut_match_temp_32 = _coconut.getattr(_coconut_match_temp_28, _coconut_match_temp_31[0], _coconut_sentinel)  #73 (line in Coconut source)
+                            if _coconut_match_temp_32 is not _coconut_sentinel:  #73 (line in Coconut source)
+                                _coconut_match_set_name_n = _coconut_match_temp_32  #73 (line in Coconut source)
+                                _coconut_match_check_7 = True  #73 (line in Coconut source)
+                        if _coconut_match_check_7:  #73 (line in Coconut source)
+                            if _coconut_match_set_name_n is not _coconut_sentinel:  #73 (line in Coconut source)
+                                n = _coconut_match_set_name_n  #73 (line in Coconut source)
+
+
+
+
+        if not _coconut_match_check_7:  #73 (line in Coconut source)
+            raise _coconut_FunctionMatchError('match yield async def arange_(int(n)):', _coconut_match_args)  #73 (line in Coconut source)
+
+        for x in (range(n)):  #74 (line in Coconut source)
+            await _coconut.async_generator.yield_((x))  #75 (line in Coconut source)
+        if False:  #76 (line in Coconut source)
+            await _coconut.async_generator.yield_()  #76 (line in Coconut source)
+
+    async def aconsume(ait):  #76 (line in Coconut source)
+        async for _ in (ait):  #77 (line in Coconut source)
+            pass  #78 (line in Coconut source)
+
+    l = []  # type: typing.List[int]  #79 (line in Coconut source)
+    if "__annotations__" not in _coconut.locals():  #79 (line in Coconut source)
+        __annotations__ = {}  # type: ignore  #79 (line in Coconut source)
+    __annotations__["l"] = 'typing.List[int]'  #79 (line in Coconut source)
+    async def aiter_test():  #80 (line in Coconut source)
+        await (aconsume)((fmap)(l.append, (toa)(range(10))))  #81 (line in Coconut source)
+        await (aconsume)((fmap)(l.append, arange_(10)))  #82 (line in Coconut source)
+
+    loop.run_until_complete(aiter_test())  #83 (line in Coconut source)
+    assert l == list(range(10)) + list(range(10))  #84 (line in Coconut source)
+
+    async def arec(x):  #86 (line in Coconut source)
+        return (await arec(x - 1) if x else x)  #86 (line in Coconut source)
+
+    async def atest():  #87 (line in Coconut source)
+        assert (await (arec)((_coconut.operator.add)(await (arec)(10), 10))) == 0  #88 (line in Coconut source)
+
+    loop.run_until_complete(atest())  #96 (line in Coconut source)
+
+    loop.close()  #98 (line in Coconut source)
+    return (True)  #99 (line in Coconut source)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# __coconut_hash__ = 0x8f74695c
+
+# Compiled with Coconut version 3.1.2
+
+# Coconut Header: -------------------------------------------------------------
+
+import sys as _coconut_sys
+import os as _coconut_os
+_coconut_header_info = ('3.1.2', '3', False)
+_coconut_cached__coconut__ = _coconut_sys.modules.get('__coconut__')
+_coconut_file_dir = _coconut_os.path.dirname(_coconut_os.path.abspath(__file__))
+_coconut_pop_path = False
+if _coconut_cached__coconut__ is None or getattr(_coconut_cached__coconut__, "_coconut_header_info", None) != _coconut_header_info and _coconut_os.path.dirname(_coconut_cached__coconut__.__file__ or "") != _coconut_file_dir:  # type: ignore
+    if _coconut_cached__coconut__ is not None:
+        _coconut_sys.modules['_coconut_cached__coconut__'] = _coconut_cached__coconut__
+        del _coconut_sys.modules['__coconut__']
+    _coconut_sys.path.insert(0, _coconut_file_dir)
+    _coconut_pop_path = True
+    _coconut_module_name = _coconut_os.path.splitext(_coconut_os.path.basename(_coconut_file_dir))[0]
+    if _coconut_module_name and _coconut_module_name[0].isalpha() and all(c.isalpha() or c.isdigit() for c in _coconut_module_name) and "__init__.py" in _coconut_os.listdir(_coconut_file_dir):  # type: ignore
+        _coconut_full_module_name = str(_coconut_module_name + ".__coconut__")  # type: ignore
+        import __coconut__ as _coconut__coconut__
+        _coconut__coconut__.__name__ = _coconut_full_module_name
+        for _coconut_v in vars(_coconut__coconut__).values():  # type: ignore
+            if getattr(_coconut_v, "__module__", None) == '__coconut__':  # type: ignore
+                try:
+                    _coconut_v.__module__ = _coconut_full_module_name
+                except AttributeError:
+                    _coconut_v_type = type(_coconut_v)  # type: ignore
+                    if getattr(_coconut_v_type, "__module__", None) == '__coconut__':  # type: ignore
+                        _coconut_v_type.__module__ = _coconut_full_module_name
+        _coconut_sys.modules[_coconut_full_module_name] = _coconut__coconut__
+from __coconut__ import *
+from __coconut__ import _coconut_tail_call, _coconut_tco, _coconut_call_set_names, _namedtuple_of, _coconut, _coconut_Expected, _coconut_MatchError, _coconut_SupportsAdd, _coconut_SupportsMinus, _coconut_SupportsMul, _coconut_SupportsPow, _coconut_SupportsTruediv, _coconut_SupportsFloordiv, _coconut_SupportsMod, _coconut_SupportsAnd, _coconut_SupportsXor, _coconut_SupportsOr, _coconut_SupportsLshift, _coconut_SupportsRshift, _coconut_SupportsMatmul, _coconut_SupportsInv, _coconut_iter_getitem, _coconut_base_compose, _coconut_forward_compose, _coconut_back_compose, _coconut_forward_star_compose, _coconut_back_star_compose, _coconut_forward_dubstar_compose, _coconut_back_dubstar_compose, _coconut_pipe, _coconut_star_pipe, _coconut_dubstar_pipe, _coconut_back_pipe, _coconut_back_star_pipe, _coconut_back_dubstar_pipe, _coconut_none_pipe, _coconut_none_star_pipe, _coconut_none_dubstar_pipe, _coconut_bool_and, _coconut_bool_or, _coconut_none_coalesce, _coconut_minus, _coconut_map, _coconut_partial, _coconut_complex_partial, _coconut_get_function_match_error, _coconut_base_pattern_func, _coconut_addpattern, _coconut_sentinel, _coconut_assert, _coconut_raise, _coconut_mark_as_match, _coconut_reiterable, _coconut_self_match_types, _coconut_dict_merge, _coconut_exec, _coconut_comma_op, _coconut_arr_concat_op, _coconut_arr_literal, _coconut_mk_anon_namedtuple, _coconut_matmul, _coconut_py_str, _coconut_flatten, _coconut_multiset, _coconut_back_none_pipe, _coconut_back_none_star_pipe, _coconut_back_none_dubstar_pipe, _coconut_forward_none_compose, _coconut_back_none_compose, _coconut_forward_none_star_compose, _coconut_back_none_star_compose, _coconut_forward_none_dubstar_compose, _coconut_back_none_dubstar_compose, _coconut_call_or_coefficient, _coconut_in, _coconut_not_in, _coconut_attritemgetter, _coconut_if_op, _coconut_CoconutWarning
+if _coconut_pop_path:
+    _coconut_sys.path.pop(0)
+try:
+    __file__ = _coconut_os.path.abspath(__file__) if __file__ else __file__
+except NameError:
+    pass
+else:
+    if __file__ and '__coconut_cache__' in __file__:
+        _coconut_file_comps = []
+        while __file__:
+            __file__, _coconut_file_comp = _coconut_os.path.split(__file__)
+            if not _coconut_file_comp:
+                _coconut_file_comps.append(__file__)
+                break
+            if _coconut_file_comp != '__coconut_cache__':
+                _coconut_file_comps.append(_coconut_file_comp)
+        __file__ = _coconut_os.path.join(*reversed(_coconut_file_comps))
+
+# Compiled Coconut: -----------------------------------------------------------
+
+try:  #1 (line in Coconut source)
+    _coconut_sys_0 = sys  # type: ignore  #1 (line in Coconut source)
+except _coconut.NameError:  #1 (line in Coconut source)
+    _coconut_sys_0 = _coconut_sentinel  #1 (line in Coconut source)
+sys = _coconut_sys  #1 (line in Coconut source)
+if sys.version_info >= (3, 8):  #1 (line in Coconut source)
+    if _coconut.typing.TYPE_CHECKING:  #1 (line in Coconut source)
+        from typing import Literal  #1 (line in Coconut source)
+    else:  #1 (line in Coconut source)
+        try:  #1 (line in Coconut source)
+            Literal = _coconut.typing.Literal  #1 (line in Coconut source)
+        except _coconut.AttributeError as _coconut_imp_err:  #1 (line in Coconut source)
+            raise _coconut.ImportError(_coconut.str(_coconut_imp_err))  #1 (line in Coconut source)
+else:  #1 (line in Coconut source)
+    from typing_extensions import Literal  #1 (line in Coconut source)
+if _coconut_sys_0 is not _coconut_sentinel:  #1 (line in Coconut source)
+    sys = _coconut_sys_0  #1 (line in Coconut source)
+
+def py3_test() -> 'bool':  #3 (line in Coconut source)
+    """Performs Python-3-specific tests."""  #4 (line in Coconut source)
+    five = 5  # type: Literal[5]  #5 (line in Coconut source)
+    if "__annotations__" not in _coconut.locals():  #5 (line in Coconut source)
+        __annotations__ = {}  # type: ignore  #5 (line in Coconut source)
+    __annotations__["five"] = 'Literal[5]'  #5 (line in Coconut source)
+    assert five == 5  #6 (line in Coconut source)
+    x = five  # type: int  #7 (line in Coconut source)
+    if "__annotations__" not in _coconut.locals():  #7 (line in Coconut source)
+        __annotations__ = {}  # type: ignore  #7 (line in Coconut source)
+    __annotations__["x"] = 'int'  #7 (line in Coconut source)
+    assert x == 5  #8 (line in Coconut source)
+    def set_x(y):  #9 (line in Coconut source)
+        nonlocal x  #10 (line in Coconut source)
+        x = y  #11 (line in Coconut source)
+
+    set_x(3)  #12 (line in Coconut source)
+    assert x == 3  #13 (line in Coconut source)
+    def set_x_again(y):  #14 (line in Coconut source)
+        nonlocal x  #15 (line in Coconut source)
+        x = y  #15 (line in Coconut source)
+
+    set_x_again(10)  #16 (line in Coconut source)
+    assert x == 10  #17 (line in Coconut source)
+    assert _coconut.dict(((x), (x)) for x in range(5)) == _coconut.dict(((0, 0), (1, 1), (2, 2), (3, 3), (4, 4)))  #18 (line in Coconut source)
+    def head_tail(l):  #19 (line in Coconut source)
+        head, *tail = l  #20 (line in Coconut source)
+        return head, tail  #21 (line in Coconut source)
+
+    assert head_tail(_coconut_reiterable(_coconut_func() for _coconut_func in (lambda: 1, lambda: 2, lambda: 3))) == (1, [2, 3])  #22 (line in Coconut source)
+    assert (tuple)(py_map(lambda x: x + 1, range(4))) == (1, 2, 3, 4)  #23 (line in Coconut source)
+    assert (tuple)(py_zip(range(3), range(3))) == ((0, 0), (1, 1), (2, 2))  #24 (line in Coconut source)
+    def keyword_only(*, a):  #25 (line in Coconut source)
+        return a  #25 (line in Coconut source)
+
+    assert keyword_only(a=10) == 10  #26 (line in Coconut source)
+    čeština = "czech"  #27 (line in Coconut source)
+    assert čeština == "czech"  #28 (line in Coconut source)
+    class HasExecMethod():  #29 (line in Coconut source)
+        @_coconut_tco  #30 (line in Coconut source)
+        def exec(self, x):  #30 (line in Coconut source)
+            return _coconut_tail_call(x)  #30 (line in Coconut source)
+
+    _coconut_call_set_names(HasExecMethod)  #31 (line in Coconut source)
+    has_exec = HasExecMethod()  #31 (line in Coconut source)
+    assert hasattr(has_exec, "exec")  #32 (line in Coconut source)
+    assert has_exec.exec(lambda _=None: 1) == 1  #33 (line in Coconut source)
+    def exec_rebind_test():  #34 (line in Coconut source)
+        exec = 1  #35 (line in Coconut source)
+        assert exec + 1 == 2  #36 (line in Coconut source)
+        def exec(x):  #37 (line in Coconut source)
+            return x  #37 (line in Coconut source)
+
+        assert exec(1) == 1  #38 (line in Coconut source)
+        return True  #39 (line in Coconut source)
+
+    assert exec_rebind_test() is True  #40 (line in Coconut source)
+    return True  #41 (line in Coconut source)
@@ -54,6 +54,7 @@ from coconut.constants import (
     PY26,
     PY35,
     PY36,
+    PY37,
     PY38,
     PY39,
     PY310,
@@ -61,6 +62,8 @@ from coconut.constants import (
     CPYTHON,
     adaptive_any_of_env_var,
     reverse_any_of_env_var,
+    grammar_snapshot_dir_env_var,
+    use_grammar_snapshot_env_var,
     supported_py2_vers,
     supported_py3_vers,
     icoconut_default_kernel_names,
@@ -68,6 +71,7 @@ from coconut.constants import (
     mypy_err_infixes,
     get_bool_env_var,
     coconut_cache_dir,
+    import_record_ext,
     default_use_cache_dir,
     base_dir,
     fixpath,
@@ -896,6 +900,14 @@ class TestShell(unittest.TestCase):
     def test_api(self):
         call_python(["-c", 'from coconut.api import parse; exec(parse("' + coconut_snip + '"))'], assert_output=True)
 
+    if PY38:
+        def test_grammar_snapshot(self):
+            with using_dest():
+                with using_env_vars({use_grammar_snapshot_env_var: "True", grammar_snapshot_dir_env_var: dest}):
+                    for _ in range(2):  # the first run saves the snapshot and the second loads it
+                        call_python(["-c", 'from coconut.api import setup, warm_up, parse; setup(); warm_up(streamline=True); exec(parse("' + coconut_snip + '"))'], assert_output=True)
+                    assert os.listdir(dest)
+
     def test_import_hook(self):
         with using_sys_path(src):
             with using_paths(runnable_compiled_loc, importable_compiled_loc):
@@ -906,6 +918,17 @@ class TestShell(unittest.TestCase):
                         reload(runnable)
         assert runnable.success == "<success>"
 
+    if default_use_cache_dir:
+        def test_import_record(self):
+            with using_dest():
+                with open(os.path.join(dest, "import_record_test.coco"), "w") as record_test_file:
+                    record_test_file.write('success = "<success>" |> str\n')
+                import_record_test = "import sys; sys.path.insert(0, {dest!r}); from coconut.api import coconut_importer; import import_record_test; print(import_record_test.success if coconut_importer.command is {is_none} else None)"
+                call_python(["-c", import_record_test.format(dest=dest, is_none="not None")], assert_output=True)
+                assert os.path.exists(os.path.join(dest, coconut_cache_dir, "import_record_test.coco" + import_record_ext))
+                # the second import in a new process should use the record rather than set up the compiler
+                call_python(["-c", import_record_test.format(dest=dest, is_none="None")], assert_output=True)
+
     def test_find_packages(self):
         with using_pys_in(agnostic_dir):
             with using_coconut():
@@ -924,6 +947,34 @@ class TestShell(unittest.TestCase):
             comp_runnable()
             call_python([runnable_py, "--arg"], assert_output=True)
 
+    if PY37:
+        def test_compile_runnable_bytecode(self):
+            from importlib.util import cache_from_source
+            runnable_pycs = [cache_from_source(runnable_py, optimization=opt) for opt in ("", 2)]
+            with using_paths(runnable_py, importable_py, *runnable_pycs):
+                comp_runnable(["--bytecode", "0,2"])
+                for runnable_pyc in runnable_pycs:
+                    assert os.path.isfile(runnable_pyc), runnable_pyc
+                call_python([runnable_py, "--arg"], assert_output=True)
+
+    def test_compile_runnable_multi_target(self):
+        with using_dest():
+            call_coconut([runnable_coco, dest, "--and", importable_coco, dest, "--target", "3.8,3.13"], assert_output="saved")
+            for target in ("3.8", "3.13"):
+                for filename in ("runnable.py", "importable.py"):
+                    assert os.path.isfile(os.path.join(dest, target, filename)), (target, filename)
+
+    if PY37 and not WINDOWS:
+        def test_parallel_parse(self):
+            with using_dest():
+                parallel_coco = os.path.join(dest, "parallel.coco")
+                with open(parallel_coco, "w") as parallel_file:
+                    for i in range(500):
+                        parallel_file.write("def f{i}(x) = x |> (.+{i})\n".format(i=i))
+                    parallel_file.write("assert f499(1) == 500\nprint('<success>')\n")
+                call_coconut([parallel_coco, "--jobs", "2", "--parallel-parse", "--force"], assert_output="chunks on", assert_output_only_at_end=False)
+                call_python([os.path.join(dest, "parallel.py")], assert_output=True)
+
     def test_import_runnable(self):
         with using_paths(runnable_py, importable_py):
             comp_runnable()
@@ -1013,6 +1064,9 @@ class TestCompilation(unittest.TestCase):
     def test_simple_minify(self):
         run_runnable(["-n", "--minify"])
 
+    def test_simple_tree_shake(self):
+        run_runnable(["-n", "--tree-shake"])
+
     if sys.version_info >= get_target_info(get_psf_target()):
         def test_simple_psf(self):
             run_runnable(["-n", "--target", "psf"])
@@ -1061,6 +1115,9 @@ class TestCompilation(unittest.TestCase):
         def test_and(self):
             run(["--and"])  # src and dest built by comp
 
+        def test_package_tree_shake(self):
+            run(["--package", "--tree-shake"])
+
         def test_run_arg(self):
             run(use_run_arg=True)
 